@@ -1,20 +1,39 @@
 import dash
-from dash import dcc, html, dash_table, Input, Output, State, callback_context, ALL
+from dash import dcc, html, dash_table, Input, Output, State, callback_context, ALL, Patch
+from dash.dash_table import FormatTemplate
+from dash.dash_table.Format import Format, Group, Scheme, Sign, Symbol
 from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 import yfinance as yf
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
+from functools import lru_cache
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import heapq
 import json
 import os
+import time
 import uuid
 import base64
 import csv
 import io
 
+# orjson parses/serializes JSON several times faster than stdlib json;
+# fall back to stdlib when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Fast parser for small JSON strings such as pattern-matching prop ids
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 # Load environment variables for cloud deployment
 from dotenv import load_dotenv
 load_dotenv()
@@ -26,7 +45,7 @@ if USE_CLOUD_DB:
     # Use Supabase for cloud deployment
     from database import (
         load_watchlist, save_watchlist,
-        load_portfolio, save_portfolio,
+        load_portfolio, save_portfolio, save_portfolio_async,
         load_portfolio_history, save_portfolio_history,
         load_trades, save_trades,
         load_income, save_income,
@@ -46,65 +65,104 @@ else:
     ALERTS_FILE = os.path.join(os.path.dirname(__file__), "alerts.json")
     SETTINGS_FILE = os.path.join(os.path.dirname(__file__), "settings.json")
 
+    @lru_cache(maxsize=16)
+    def _load_json_cached(path, mtime):
+        """Parse a JSON file, memoized on (path, mtime)
+
+        Several callbacks fire per user interaction and each re-reads the same
+        files; the mtime key means the bytes are only re-parsed after a save.
+        """
+        if orjson is not None:
+            with open(path, 'rb') as f:
+                return orjson.loads(f.read())
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def _load_json_file(path):
+        """Load a JSON file through the mtime-keyed cache"""
+        return _load_json_cached(path, os.path.getmtime(path))
+
+    _last_write_hash = {}
+
+    def _write_json_file(path, data):
+        """Serialize and write a JSON file
+
+        Skips the write entirely when the payload matches the last one written
+        to this path, and otherwise writes to a temp file and atomically
+        renames it into place so readers never see a partial file.
+        """
+        if orjson is not None:
+            # OPT_SERIALIZE_NUMPY: payloads carry numpy scalars (e.g. the
+            # portfolio snapshot's Close-price math) that orjson otherwise
+            # rejects, even though stdlib json accepts them as float subclasses
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            payload = json.dumps(data, indent=2).encode()
+
+        digest = hashlib.blake2b(payload, digest_size=8).digest()
+        if _last_write_hash.get(path) == digest:
+            return
+
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+        _last_write_hash[path] = digest
+
     def load_watchlist():
         """Load watchlist from JSON file"""
         if os.path.exists(WATCHLIST_FILE):
             try:
-                with open(WATCHLIST_FILE, 'r') as f:
-                    return json.load(f)
+                return _load_json_file(WATCHLIST_FILE)
             except:
                 return {"tickers": []}
         return {"tickers": []}
 
     def save_watchlist(data):
         """Save watchlist to JSON file"""
-        with open(WATCHLIST_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json_file(WATCHLIST_FILE, data)
 
     def load_portfolio():
         """Load portfolio from JSON file"""
         if os.path.exists(PORTFOLIO_FILE):
             try:
-                with open(PORTFOLIO_FILE, 'r') as f:
-                    return json.load(f)
+                return _load_json_file(PORTFOLIO_FILE)
             except:
                 return {"accounts": []}
         return {"accounts": []}
 
     def save_portfolio(data):
         """Save portfolio to JSON file"""
-        with open(PORTFOLIO_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json_file(PORTFOLIO_FILE, data)
+
+    # Local writes are fast enough to stay synchronous
+    save_portfolio_async = save_portfolio
 
     def load_portfolio_history():
         """Load portfolio history from JSON file"""
         if os.path.exists(PORTFOLIO_HISTORY_FILE):
             try:
-                with open(PORTFOLIO_HISTORY_FILE, 'r') as f:
-                    return json.load(f)
+                return _load_json_file(PORTFOLIO_HISTORY_FILE)
             except:
                 return {"snapshots": []}
         return {"snapshots": []}
 
     def save_portfolio_history(data):
         """Save portfolio history to JSON file"""
-        with open(PORTFOLIO_HISTORY_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json_file(PORTFOLIO_HISTORY_FILE, data)
 
     def load_trades():
         """Load trades from JSON file"""
         if os.path.exists(TRADES_FILE):
             try:
-                with open(TRADES_FILE, 'r') as f:
-                    return json.load(f)
+                return _load_json_file(TRADES_FILE)
             except:
                 return {"trades": []}
         return {"trades": []}
 
     def save_trades(data):
         """Save trades to JSON file"""
-        with open(TRADES_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json_file(TRADES_FILE, data)
 
     def load_income():
         """Load income from JSON file"""
@@ -115,21 +173,19 @@ else:
         }
         if os.path.exists(INCOME_FILE):
             try:
-                with open(INCOME_FILE, 'r') as f:
-                    data = json.load(f)
-                    if "recurring" not in data:
-                        data["recurring"] = []
-                    if "rsus" not in data:
-                        data["rsus"] = []
-                    return data
+                data = _load_json_file(INCOME_FILE)
+                if "recurring" not in data:
+                    data["recurring"] = []
+                if "rsus" not in data:
+                    data["rsus"] = []
+                return data
             except:
                 return default_data
         return default_data
 
     def save_income(data):
         """Save income to JSON file"""
-        with open(INCOME_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json_file(INCOME_FILE, data)
 
     def load_expenses():
         """Load expenses from JSON file"""
@@ -137,51 +193,45 @@ else:
         default_data = {"expenses": [], "categories": default_categories, "budgets": {}}
         if os.path.exists(EXPENSES_FILE):
             try:
-                with open(EXPENSES_FILE, 'r') as f:
-                    data = json.load(f)
-                    if "budgets" not in data:
-                        data["budgets"] = {}
-                    if "Food" in data.get("categories", []):
-                        data["categories"] = default_categories
-                    return data
+                data = _load_json_file(EXPENSES_FILE)
+                if "budgets" not in data:
+                    data["budgets"] = {}
+                if "Food" in data.get("categories", []):
+                    data["categories"] = default_categories
+                return data
             except:
                 return default_data
         return default_data
 
     def save_expenses(data):
         """Save expenses to JSON file"""
-        with open(EXPENSES_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json_file(EXPENSES_FILE, data)
 
     def load_alerts():
         """Load alerts from JSON file"""
         if os.path.exists(ALERTS_FILE):
             try:
-                with open(ALERTS_FILE, 'r') as f:
-                    return json.load(f)
+                return _load_json_file(ALERTS_FILE)
             except:
                 return {"alerts": []}
         return {"alerts": []}
 
     def save_alerts(data):
         """Save alerts to JSON file"""
-        with open(ALERTS_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json_file(ALERTS_FILE, data)
 
     def load_settings():
         """Load settings from JSON file"""
         if os.path.exists(SETTINGS_FILE):
             try:
-                with open(SETTINGS_FILE, 'r') as f:
-                    return json.load(f)
+                return _load_json_file(SETTINGS_FILE)
             except:
                 return {"target_allocations": {}, "rebalance_threshold": 5}
         return {"target_allocations": {}, "rebalance_threshold": 5}
 
     def save_settings(data):
         """Save settings to JSON file"""
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json_file(SETTINGS_FILE, data)
 
 # Initialize the Dash app
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP], suppress_callback_exceptions=True)
@@ -932,7 +982,15 @@ def create_table(data, columns):
 # ============================================================================
 
 def get_stock_quick_data(ticker_symbol):
-    """Get quick stock data for watchlist/portfolio display"""
+    """Get quick stock data for watchlist/portfolio display
+
+    Memoized for ~60 seconds: the same ticker held in several accounts or
+    referenced by several alerts is fetched once per minute, not once per row.
+    """
+    return _fetch_stock_quick_data(ticker_symbol, int(time.time() // 60))
+
+@lru_cache(maxsize=512)
+def _fetch_stock_quick_data(ticker_symbol, minute_bucket):
     try:
         ticker = yf.Ticker(ticker_symbol)
         hist = ticker.history(period="1y")  # Get 1 year for 6M calc
@@ -1211,6 +1269,14 @@ def create_portfolio_summary(filter_account=None, filter_ticker=None, filter_dat
     total_value = 0
     total_cost = 0
 
+    # Request-scoped memo: the same ticker held in several accounts is
+    # fetched once per render
+    quote_memo = {}
+    def _quote(tk):
+        if tk not in quote_memo:
+            quote_memo[tk] = get_stock_quick_data(tk)
+        return quote_memo[tk]
+
     for account in accounts:
         account_value = 0
         account_cost = 0
@@ -1220,7 +1286,7 @@ def create_portfolio_summary(filter_account=None, filter_ticker=None, filter_dat
             if filter_ticker and filter_ticker.upper() not in holding["ticker"].upper():
                 continue
 
-            data = get_stock_quick_data(holding["ticker"])
+            data = _quote(holding["ticker"])
             if data:
                 current_val = data["price"] * holding["shares"]
                 cost_basis = holding["avg_cost"] * holding["shares"]
@@ -1425,6 +1491,11 @@ def create_portfolio_page():
                      [{"label": t, "value": t} for t in sorted(all_tickers)]
 
     return html.Div([
+        # Quote snapshot shared by the render callback; refreshed on an interval
+        # so filter/time-button clicks reuse cached prices instead of refetching
+        dcc.Store(id="portfolio-quotes-cache"),
+        dcc.Store(id="portfolio-data"),
+        dcc.Interval(id="portfolio-refresh", interval=60_000),
         # Portfolio Overview with Graph
         html.Div([
             html.H4("Portfolio Overview", className="section-title", style={"marginTop": "0"}),
@@ -2968,13 +3039,20 @@ def create_full_portfolio_view():
     grand_total_value = 0
     grand_total_cost = 0
 
+    # Request-scoped memo, same pattern as create_portfolio_summary
+    quote_memo = {}
+    def _quote(tk):
+        if tk not in quote_memo:
+            quote_memo[tk] = get_stock_quick_data(tk)
+        return quote_memo[tk]
+
     for acc in accounts:
         holdings_rows = []
         account_total_value = 0
         account_total_cost = 0
 
         for holding in acc.get("holdings", []):
-            data = get_stock_quick_data(holding["ticker"])
+            data = _quote(holding["ticker"])
             if data:
                 current_val = data["price"] * holding["shares"]
                 cost_basis = holding["avg_cost"] * holding["shares"]
@@ -4165,6 +4243,15 @@ EXPENSE_CATEGORY_COLORS = {
     "Other": "#C9C9C9"
 }
 
+# Translation table for stripping currency formatting - str.translate is much
+# faster than chained str.replace for single-character deletions
+_AMOUNT_DELETE = str.maketrans('', '', '$,')
+
+def _parse_amount(val):
+    """Clean a raw amount string ($1,234.56 or (12.34)) and return abs(float)"""
+    s = str(val).translate(_AMOUNT_DELETE).replace('(', '-').replace(')', '')
+    return abs(float(s))
+
 def parse_capital_one_csv(df):
     """Parse Capital One credit card CSV format"""
     parsed = []
@@ -4174,34 +4261,37 @@ def parse_capital_one_csv(df):
     if not all(col in df.columns for col in required_cols):
         return None  # Not Capital One format
 
-    for _, row in df.iterrows():
+    from dateutil import parser as date_parser
+
+    # Iterate raw column arrays - avoids building a Series per row like iterrows
+    rows = zip(df['Transaction Date'].to_numpy(), df['Description'].to_numpy(),
+               df['Category'].to_numpy(), df['Debit'].to_numpy())
+    for date_val, desc_val, cat_val, debit_val in rows:
         try:
             # Skip Payment/Credit transactions
-            if row.get('Category', '') == 'Payment/Credit':
+            if cat_val == 'Payment/Credit':
                 continue
 
             # Skip if no Debit amount (these are credits/payments)
-            debit_val = row.get('Debit', '')
             if pd.isna(debit_val) or str(debit_val).strip() == '':
                 continue
 
             # Parse date
-            date_val = str(row['Transaction Date'])
+            date_val = str(date_val)
             try:
-                from dateutil import parser as date_parser
                 parsed_date = date_parser.parse(date_val)
                 date_str = parsed_date.strftime("%Y-%m-%d")
             except:
                 date_str = date_val[:10]
 
             # Get description
-            desc = str(row['Description']).strip()
+            desc = str(desc_val).strip()
 
             # Parse amount
-            amount = abs(float(str(debit_val).replace('$', '').replace(',', '')))
+            amount = _parse_amount(debit_val)
 
             # Map category using Capital One category
-            original_category = str(row.get('Category', 'Other')).strip()
+            original_category = str(cat_val).strip() if not pd.isna(cat_val) else 'Other'
             mapped_category = CAPITAL_ONE_CATEGORY_MAP.get(original_category, 'Other')
 
             if amount > 0:
@@ -4247,19 +4337,19 @@ def parse_bank_csv(df, bank_type='auto'):
         else:
             return []
 
-    for _, row in df.iterrows():
+    from dateutil import parser as date_parser
+
+    for date_val, desc_val, amt_val in zip(df[date_col].to_numpy(), df[desc_col].to_numpy(), df[amount_col].to_numpy()):
         try:
-            date_val = str(row[date_col])
+            date_val = str(date_val)
             try:
-                from dateutil import parser as date_parser
                 parsed_date = date_parser.parse(date_val)
                 date_str = parsed_date.strftime("%Y-%m-%d")
             except:
                 date_str = date_val[:10]
 
-            desc = str(row[desc_col])
-            amount_str = str(row[amount_col]).replace('$', '').replace(',', '').replace('(', '-').replace(')', '')
-            amount = abs(float(amount_str))
+            desc = str(desc_val)
+            amount = _parse_amount(amt_val)
 
             category = auto_categorize(desc, categories)
 
@@ -4303,35 +4393,73 @@ def auto_categorize(description, categories):
     return 'Other'
 
 def get_expense_hash(expense):
-    """Generate a hash for duplicate detection"""
-    return f"{expense.get('date', '')}|{expense.get('description', '').lower()[:50]}|{expense.get('amount', 0):.2f}"
+    """Generate a key for duplicate detection
+
+    Returns a tuple rather than a formatted string - sets hash tuples natively
+    in C, so this skips the per-expense f-string allocation entirely.
+    """
+    return (expense.get('date', ''),
+            expense.get('description', '').lower()[:50],
+            round(expense.get('amount', 0), 2))
+
+# Incrementally-maintained index of expense hashes for duplicate detection.
+# The count acts as a consistency check: if it drifts from the actual expense
+# list (a delete/edit invalidated it), the set is rebuilt on next use.
+_expense_hash_index = {"count": -1, "hashes": set()}
+
+def _get_existing_hashes(expenses):
+    """Return the cached hash set for existing expenses, rebuilding if stale"""
+    if _expense_hash_index["count"] != len(expenses):
+        _expense_hash_index["hashes"] = {get_expense_hash(e) for e in expenses}
+        _expense_hash_index["count"] = len(expenses)
+    return _expense_hash_index["hashes"]
+
+def _hash_index_add(new_expenses, total_count):
+    """Fold newly appended expenses into the cached hash set"""
+    if _expense_hash_index["count"] >= 0:
+        _expense_hash_index["hashes"].update(get_expense_hash(e) for e in new_expenses)
+        _expense_hash_index["count"] = total_count
+
+def _hash_index_invalidate():
+    """Force a rebuild on next use (after deletes/edits)"""
+    _expense_hash_index["count"] = -1
 
 def find_duplicates(new_expenses, existing_expenses):
-    """Find potential duplicates between new and existing expenses"""
-    existing_hashes = {get_expense_hash(e) for e in existing_expenses}
+    """Find potential duplicates between new and existing expenses
+
+    Tags each new expense with a '_dup' flag so callers can check duplicate
+    status per row in O(1) instead of scanning the duplicates list.
+    """
+    existing_hashes = _get_existing_hashes(existing_expenses)
     duplicates = []
     unique = []
 
     for exp in new_expenses:
-        if get_expense_hash(exp) in existing_hashes:
-            duplicates.append(exp)
-        else:
-            unique.append(exp)
+        is_dup = get_expense_hash(exp) in existing_hashes
+        exp['_dup'] = is_dup
+        (duplicates if is_dup else unique).append(exp)
 
     return unique, duplicates
 
-# Callback: Tab switching for Add/Import
-@app.callback(
+# Last-rendered pill order per month, so refresh triggers can patch amounts
+# in place instead of rebuilding the whole pill list
+_pill_cache = {"month": None, "order": None}
+
+# Callback: Tab switching for Add/Import - pure style flip, so run it in the
+# browser instead of round-tripping to the server on every tab click
+app.clientside_callback(
+    """
+    function(active_tab) {
+        if (active_tab === 'tab-add-expense') {
+            return [{display: 'block'}, {display: 'none'}];
+        }
+        return [{display: 'none'}, {display: 'block'}];
+    }
+    """,
     [Output('add-expense-form', 'style'),
      Output('import-csv-form', 'style')],
-    Input('expense-input-tabs', 'active_tab'),
-    prevent_initial_call=False
+    Input('expense-input-tabs', 'active_tab')
 )
-def toggle_expense_input_tabs(active_tab):
-    if active_tab == 'tab-add-expense':
-        return {"display": "block"}, {"display": "none"}
-    else:
-        return {"display": "none"}, {"display": "block"}
 
 # Callback: Month navigation and overview
 @app.callback(
@@ -4431,19 +4559,35 @@ def update_expense_overview(prev_clicks, next_clicks, refresh, current_month):
         c = e.get('category', 'Other')
         cat_totals[c] = cat_totals.get(c, 0) + e.get('amount', 0)
 
-    pills = []
-    for cat, amount in sorted(cat_totals.items(), key=lambda x: -x[1]):
-        color = EXPENSE_CATEGORY_COLORS.get(cat, "#888")
-        pills.append(html.Div([
-            html.Span(cat, style={"fontWeight": "600", "marginRight": "5px"}),
-            html.Span(f"${amount:,.0f}", style={"color": "#666"})
-        ], style={
-            "backgroundColor": f"{color}22",
-            "border": f"1px solid {color}",
-            "borderRadius": "20px",
-            "padding": "5px 15px",
-            "fontSize": "0.85rem"
-        }))
+    sorted_cats = sorted(cat_totals.items(), key=lambda x: -x[1])
+    pill_order = [cat for cat, _ in sorted_cats]
+    trigger = ctx.triggered[0]['prop_id'] if ctx.triggered else ''
+
+    if (trigger == 'expense-refresh-trigger.children'
+            and _pill_cache["month"] == current_month
+            and _pill_cache["order"] == pill_order):
+        # Same month, same pill order - patch just the dollar amounts instead
+        # of rebuilding and reserializing the whole pill list
+        pills = Patch()
+        for i, (cat, amount) in enumerate(sorted_cats):
+            pills[i]['props']['children'][1]['props']['children'] = f"${amount:,.0f}"
+    else:
+        pills = []
+        get_cat_color = EXPENSE_CATEGORY_COLORS.get
+        for cat, amount in sorted_cats:
+            color = get_cat_color(cat, "#888")
+            pills.append(html.Div([
+                html.Span(cat, style={"fontWeight": "600", "marginRight": "5px"}),
+                html.Span(f"${amount:,.0f}", style={"color": "#666"})
+            ], style={
+                "backgroundColor": f"{color}22",
+                "border": f"1px solid {color}",
+                "borderRadius": "20px",
+                "padding": "5px 15px",
+                "fontSize": "0.85rem"
+            }))
+        _pill_cache["month"] = current_month
+        _pill_cache["order"] = pill_order
 
     # Build month options for dropdowns
     all_months = sorted(set(e.get('date', '')[:7] for e in expenses if e.get('date')), reverse=True)
@@ -4510,10 +4654,11 @@ def update_budget_progress(selected_month, save_clicks, copy_clicks, budget_valu
 
     # Build progress bars
     rows = []
+    get_cat_color = EXPENSE_CATEGORY_COLORS.get
     for cat in categories:
         spent = cat_spent.get(cat, 0)
         budget = month_budgets.get(cat, 0)
-        color = EXPENSE_CATEGORY_COLORS.get(cat, "#888")
+        color = get_cat_color(cat, "#888")
 
         if budget > 0:
             pct = min((spent / budget) * 100, 100)
@@ -4589,11 +4734,32 @@ def update_budget_progress(selected_month, save_clicks, copy_clicks, budget_valu
     prevent_initial_call=False
 )
 def update_expense_charts(selected_month, refresh):
-    expenses_data = load_expenses()
-    expenses = expenses_data.get('expenses', [])
-
     if selected_month is None:
         selected_month = datetime.now().strftime("%Y-%m")
+    return _build_expense_charts(selected_month, _expenses_mtime())
+
+def _expenses_mtime():
+    """Modification time of the expenses file, used as a memoization key
+
+    Cloud mode has no file to stat, so it returns a fresh timestamp each call,
+    which effectively disables the chart cache there.
+    """
+    if USE_CLOUD_DB:
+        return datetime.now().timestamp()
+    try:
+        return os.path.getmtime(EXPENSES_FILE)
+    except OSError:
+        return 0
+
+@lru_cache(maxsize=32)
+def _build_expense_charts(selected_month, mtime):
+    """Build the (pie, bar) expense figures for a month
+
+    Memoized on (month, file mtime): revisiting a month without an intervening
+    save returns the cached figures and skips Plotly construction entirely.
+    """
+    expenses_data = load_expenses()
+    expenses = expenses_data.get('expenses', [])
 
     # Filter for selected month
     month_expenses = [e for e in expenses if e.get('date', '').startswith(selected_month)]
@@ -4605,7 +4771,8 @@ def update_expense_charts(selected_month, refresh):
         cat_totals[c] = cat_totals.get(c, 0) + e.get('amount', 0)
 
     if cat_totals:
-        colors = [EXPENSE_CATEGORY_COLORS.get(c, "#888") for c in cat_totals.keys()]
+        get_cat_color = EXPENSE_CATEGORY_COLORS.get
+        colors = [get_cat_color(c, "#888") for c in cat_totals.keys()]
         pie_fig = go.Figure(data=[go.Pie(
             labels=list(cat_totals.keys()),
             values=list(cat_totals.values()),
@@ -4713,9 +4880,10 @@ def add_expense_manually(n_clicks, expense_date, desc, amount, category):
         "imported_from": None
     }
     expenses_data['expenses'].append(new_expense)
+    _hash_index_add([new_expense], len(expenses_data['expenses']))
     save_expenses(expenses_data)
 
-    return str(datetime.now())  # Trigger refresh
+    return str(time.time_ns())  # Trigger refresh - any changing value works
 
 # Callback: CSV Upload preview
 @app.callback(
@@ -4732,7 +4900,21 @@ def handle_expense_csv_upload(contents, filename):
     try:
         content_type, content_string = contents.split(',')
         decoded = base64.b64decode(content_string)
-        df = pd.read_csv(io.StringIO(decoded.decode('utf-8')))
+
+        # Parse straight from the bytes buffer - skips the str decode pass and,
+        # with pyarrow available, parses much faster than the default engine
+        try:
+            df = pd.read_csv(io.BytesIO(decoded), engine='pyarrow')
+        except Exception:
+            df = pd.read_csv(io.BytesIO(decoded))
+
+        # Capital One files can be wide - re-read just the columns we use
+        capital_one_cols = ['Transaction Date', 'Description', 'Category', 'Debit']
+        if all(col in df.columns for col in capital_one_cols) and len(df.columns) > len(capital_one_cols):
+            try:
+                df = pd.read_csv(io.BytesIO(decoded), usecols=capital_one_cols, dtype={'Debit': 'string'})
+            except Exception:
+                pass
 
         # Parse the CSV
         parsed = parse_bank_csv(df, 'auto')
@@ -4745,19 +4927,23 @@ def handle_expense_csv_upload(contents, filename):
         existing_expenses = expenses_data.get('expenses', [])
         unique, duplicates = find_duplicates(parsed, existing_expenses)
 
-        # Build preview table
-        preview_rows = []
-        for row in parsed[:15]:
-            is_dup = row in duplicates
-            row_style = {"backgroundColor": "#fff3cd"} if is_dup else {}
-            preview_rows.append(html.Tr([
-                html.Td(row['date'], style={"fontSize": "0.85rem"}),
-                html.Td(row['description'][:35] + ('...' if len(row['description']) > 35 else ''),
-                       style={"fontSize": "0.85rem"}),
-                html.Td(f"${row['amount']:,.2f}", style={"fontSize": "0.85rem", "fontWeight": "600"}),
-                html.Td(row['category'], style={"fontSize": "0.85rem"}),
-                html.Td("Duplicate" if is_dup else "", style={"fontSize": "0.75rem", "color": "#856404"})
-            ], style=row_style))
+        # Build preview table - rows carry their '_dup' flag from find_duplicates
+        Td, Tr = html.Td, html.Tr
+        cell_style = {"fontSize": "0.85rem"}
+        amount_style = {"fontSize": "0.85rem", "fontWeight": "600"}
+        dup_flag_style = {"fontSize": "0.75rem", "color": "#856404"}
+        dup_row_style = {"backgroundColor": "#fff3cd"}
+
+        preview_rows = [
+            Tr([
+                Td(row['date'], style=cell_style),
+                Td(_trunc(row['description'], 35), style=cell_style),
+                Td(f"${row['amount']:,.2f}", style=amount_style),
+                Td(row['category'], style=cell_style),
+                Td("Duplicate" if row['_dup'] else "", style=dup_flag_style)
+            ], style=dup_row_style if row['_dup'] else {})
+            for row in parsed[:15]
+        ]
 
         # Build preview UI
         preview_content = [
@@ -4835,17 +5021,19 @@ def handle_expense_csv_import(n_clicks_list, stored_data):
 
     filename = stored_data['filename']
 
-    for row in to_import:
-        new_expense = {
-            "id": str(uuid.uuid4()),
-            "date": row['date'],
-            "description": row['description'],
-            "amount": row['amount'],
-            "category": row['category'],
-            "imported_from": filename
-        }
-        expenses_data['expenses'].append(new_expense)
-
+    # Build the batch in one comprehension and extend once; uuid4().hex skips
+    # the str(UUID) formatting step
+    bulk = [{
+        "id": uuid.uuid4().hex,
+        "date": row['date'],
+        "description": row['description'],
+        "amount": row['amount'],
+        "category": row['category'],
+        "imported_from": filename
+    } for row in to_import]
+    expenses_data['expenses'].extend(bulk)
+
+    _hash_index_add(to_import, len(expenses_data['expenses']))
     save_expenses(expenses_data)
 
     success_msg = html.Div([
@@ -4856,7 +5044,115 @@ def handle_expense_csv_import(n_clicks_list, stored_data):
         ], style={"display": "flex", "alignItems": "center"})
     ], style={"padding": "20px", "backgroundColor": "#d4edda", "borderRadius": "10px"})
 
-    return success_msg, str(datetime.now())
+    return success_msg, str(time.time_ns())
+
+# Shared style singletons for the expense history table - the row render loop
+# reuses these references instead of allocating identical dicts per row
+_TD_MID = {"verticalAlign": "middle"}
+_TD_ACTIONS = {"whiteSpace": "nowrap", "verticalAlign": "middle"}
+_EDIT_INPUT_STYLE = {"fontSize": "0.85rem", "padding": "4px 8px"}
+_EDIT_AMOUNT_STYLE = {"fontSize": "0.85rem", "padding": "4px 8px", "width": "90px"}
+_EDIT_CAT_STYLE = {"fontSize": "0.85rem", "minWidth": "100px"}
+_EDIT_SAVE_BTN_STYLE = {"padding": "4px 8px", "marginRight": "5px"}
+_EDIT_CANCEL_BTN_STYLE = {"padding": "4px 8px"}
+_EDIT_ROW_STYLE = {"backgroundColor": "#fff3cd"}
+_ROW_TEXT_STYLE = {"fontSize": "0.9rem", "verticalAlign": "middle"}
+_ROW_AMOUNT_STYLE = {"color": "#dc3545", "fontWeight": "600", "fontSize": "0.9rem", "verticalAlign": "middle"}
+_ROW_EDIT_BTN_STYLE = {"padding": "2px 8px"}
+_ROW_DELETE_BTN_STYLE = {"padding": "2px 8px", "color": "#dc3545"}
+
+def _trunc(s, n=45, _dots='...'):
+    """Truncate a string to n chars with an ellipsis"""
+    return s if len(s) <= n else s[:n] + _dots
+
+# Category pill styles precomputed once - the hex-with-alpha background and
+# the rest of the style never change per render
+_CAT_PILL_STYLE = {cat: {
+    "backgroundColor": f"{color}22",
+    "color": color,
+    "padding": "3px 10px",
+    "borderRadius": "12px",
+    "fontSize": "0.8rem",
+    "fontWeight": "600"
+} for cat, color in EXPENSE_CATEGORY_COLORS.items()}
+_CAT_PILL_DEFAULT = {
+    "backgroundColor": "#88822",
+    "color": "#888",
+    "padding": "3px 10px",
+    "borderRadius": "12px",
+    "fontSize": "0.8rem",
+    "fontWeight": "600"
+}
+
+# Static subtrees of the expense table, built once and shared across renders
+_EXPENSE_TABLE_HEAD = html.Thead(html.Tr([
+    html.Th("Date", style={"width": "110px"}),
+    html.Th("Description"),
+    html.Th("Category", style={"width": "130px"}),
+    html.Th("Amount", style={"width": "100px"}),
+    html.Th("", style={"width": "90px"})
+], style={"fontSize": "0.85rem", "color": "#666"}))
+_NO_TRANSACTIONS_MSG = html.P("No transactions found.",
+                              style={"color": "#888", "padding": "20px", "textAlign": "center"})
+
+# What the last full table render looked like, so edit-mode toggles can patch
+# just the affected rows instead of re-serializing all 100
+_history_render_cache = {"key": None, "ids": None, "editing": None}
+
+def _build_expense_row(e, cat_options, is_editing):
+    """Build one expense history row, in edit or display mode"""
+    if is_editing:
+        return html.Tr([
+            html.Td(
+                dbc.Input(id={'type': 'inline-edit-date', 'id': e['id']},
+                         type="date", value=e['date'], size="sm",
+                         style=_EDIT_INPUT_STYLE),
+                style=_TD_MID
+            ),
+            html.Td(
+                dbc.Input(id={'type': 'inline-edit-desc', 'id': e['id']},
+                         value=e['description'], size="sm",
+                         style=_EDIT_INPUT_STYLE),
+                style=_TD_MID
+            ),
+            html.Td(
+                dcc.Dropdown(id={'type': 'inline-edit-cat', 'id': e['id']},
+                            options=cat_options,
+                            value=e.get('category', 'Other'),
+                            clearable=False,
+                            style=_EDIT_CAT_STYLE),
+                style=_TD_MID
+            ),
+            html.Td(
+                dbc.Input(id={'type': 'inline-edit-amount', 'id': e['id']},
+                         type="number", value=e['amount'], size="sm", step="0.01",
+                         style=_EDIT_AMOUNT_STYLE),
+                style=_TD_MID
+            ),
+            html.Td([
+                dbc.Button(html.I(className="fas fa-check"), id={'type': 'inline-edit-save', 'id': e['id']},
+                          color="success", size="sm", style=_EDIT_SAVE_BTN_STYLE),
+                dbc.Button(html.I(className="fas fa-times"), id={'type': 'inline-edit-cancel', 'id': e['id']},
+                          color="secondary", size="sm", style=_EDIT_CANCEL_BTN_STYLE)
+            ], style=_TD_ACTIONS)
+        ], style=_EDIT_ROW_STYLE)
+
+    category = e.get('category', 'Other')
+    desc = e.get('description') or ''
+    return html.Tr([
+        html.Td(e['date'], style=_ROW_TEXT_STYLE),
+        html.Td(_trunc(desc), style=_ROW_TEXT_STYLE),
+        html.Td([
+            html.Span(category, style=_CAT_PILL_STYLE.get(category, _CAT_PILL_DEFAULT))
+        ], style=_TD_MID),
+        html.Td(f"${e['amount']:,.2f}", style=_ROW_AMOUNT_STYLE),
+        html.Td([
+            dbc.Button(html.I(className="fas fa-edit"), id={'type': 'expense-edit-start', 'id': e['id']},
+                      color="link", size="sm", style=_ROW_EDIT_BTN_STYLE),
+            dbc.Button(html.I(className="fas fa-trash"), id={'type': 'expense-delete', 'id': e['id']},
+                      color="link", size="sm", style=_ROW_DELETE_BTN_STYLE)
+        ], style=_TD_ACTIONS)
+    ])
 
 # Callback: Transaction history with filtering, sorting, and inline editing
 @app.callback(
@@ -4878,10 +5174,11 @@ def update_expense_history(filter_month, filter_categories, filter_search, sort_
 
     # Handle delete
     if ctx.triggered and 'expense-delete' in ctx.triggered[0]['prop_id']:
-        import ast
-        trigger_dict = ast.literal_eval(ctx.triggered[0]['prop_id'].split('.')[0])
+        prop_id = ctx.triggered[0]['prop_id']
+        trigger_dict = _json_loads(prop_id.rsplit('.', 1)[0])
         expense_id = trigger_dict['id']
         expenses_data['expenses'] = [e for e in expenses_data['expenses'] if e['id'] != expense_id]
+        _hash_index_invalidate()
         save_expenses(expenses_data)
 
     expenses = expenses_data.get('expenses', [])
@@ -4916,86 +5213,43 @@ def update_expense_history(filter_month, filter_categories, filter_search, sort_
     count_text = f"Showing {len(filtered)} of {len(expenses)} transactions"
 
     if not filtered:
-        return html.P("No transactions found.", style={"color": "#888", "padding": "20px", "textAlign": "center"}), count_text
+        _history_render_cache["ids"] = None  # no table on screen to patch
+        return _NO_TRANSACTIONS_MSG, count_text
 
     # Build table rows with inline editing capability (limit to 100)
-    rows = []
-    for e in filtered[:100]:
-        cat_color = EXPENSE_CATEGORY_COLORS.get(e.get('category', 'Other'), '#888')
-        is_editing = editing_id == e['id']
+    visible = filtered[:100]
+    cat_options = [{"label": c, "value": c} for c in categories]
+    render_ids = [e['id'] for e in visible]
+    filter_key = (filter_month,
+                  tuple(filter_categories) if isinstance(filter_categories, list) else filter_categories,
+                  filter_search, sort_by, len(expenses))
 
-        if is_editing:
-            # Editing mode - show input fields
-            rows.append(html.Tr([
-                html.Td(
-                    dbc.Input(id={'type': 'inline-edit-date', 'id': e['id']},
-                             type="date", value=e['date'], size="sm",
-                             style={"fontSize": "0.85rem", "padding": "4px 8px"}),
-                    style={"verticalAlign": "middle"}
-                ),
-                html.Td(
-                    dbc.Input(id={'type': 'inline-edit-desc', 'id': e['id']},
-                             value=e['description'], size="sm",
-                             style={"fontSize": "0.85rem", "padding": "4px 8px"}),
-                    style={"verticalAlign": "middle"}
-                ),
-                html.Td(
-                    dcc.Dropdown(id={'type': 'inline-edit-cat', 'id': e['id']},
-                                options=[{"label": c, "value": c} for c in categories],
-                                value=e.get('category', 'Other'),
-                                clearable=False,
-                                style={"fontSize": "0.85rem", "minWidth": "100px"}),
-                    style={"verticalAlign": "middle"}
-                ),
-                html.Td(
-                    dbc.Input(id={'type': 'inline-edit-amount', 'id': e['id']},
-                             type="number", value=e['amount'], size="sm", step="0.01",
-                             style={"fontSize": "0.85rem", "padding": "4px 8px", "width": "90px"}),
-                    style={"verticalAlign": "middle"}
-                ),
-                html.Td([
-                    dbc.Button(html.I(className="fas fa-check"), id={'type': 'inline-edit-save', 'id': e['id']},
-                              color="success", size="sm", style={"padding": "4px 8px", "marginRight": "5px"}),
-                    dbc.Button(html.I(className="fas fa-times"), id={'type': 'inline-edit-cancel', 'id': e['id']},
-                              color="secondary", size="sm", style={"padding": "4px 8px"})
-                ], style={"whiteSpace": "nowrap", "verticalAlign": "middle"})
-            ], style={"backgroundColor": "#fff3cd"}))
-        else:
-            # Normal display mode
-            rows.append(html.Tr([
-                html.Td(e['date'], style={"fontSize": "0.9rem", "verticalAlign": "middle"}),
-                html.Td(e['description'][:45] + ('...' if len(e.get('description', '')) > 45 else ''),
-                       style={"fontSize": "0.9rem", "verticalAlign": "middle"}),
-                html.Td([
-                    html.Span(e.get('category', 'Other'), style={
-                        "backgroundColor": f"{cat_color}22",
-                        "color": cat_color,
-                        "padding": "3px 10px",
-                        "borderRadius": "12px",
-                        "fontSize": "0.8rem",
-                        "fontWeight": "600"
-                    })
-                ], style={"verticalAlign": "middle"}),
-                html.Td(f"${e['amount']:,.2f}", style={"color": "#dc3545", "fontWeight": "600", "fontSize": "0.9rem", "verticalAlign": "middle"}),
-                html.Td([
-                    dbc.Button(html.I(className="fas fa-edit"), id={'type': 'expense-edit-start', 'id': e['id']},
-                              color="link", size="sm", style={"padding": "2px 8px"}),
-                    dbc.Button(html.I(className="fas fa-trash"), id={'type': 'expense-delete', 'id': e['id']},
-                              color="link", size="sm", style={"padding": "2px 8px", "color": "#dc3545"})
-                ], style={"whiteSpace": "nowrap", "verticalAlign": "middle"})
-            ]))
+    trigger = ctx.triggered[0]['prop_id'] if ctx.triggered else ''
+    if (trigger == 'expense-editing-row-id.data'
+            and _history_render_cache["key"] == filter_key
+            and _history_render_cache["ids"] == render_ids):
+        # Only the edit state changed: patch the row entering edit mode and
+        # the one leaving it, leaving the other ~98 rows untouched
+        prev_editing = _history_render_cache["editing"]
+        patch = Patch()
+        for idx, e in enumerate(visible):
+            if e['id'] in (editing_id, prev_editing):
+                patch['props']['children'][1]['props']['children'][idx] = \
+                    _build_expense_row(e, cat_options, editing_id == e['id'])
+        _history_render_cache["editing"] = editing_id
+        return patch, count_text
+
+    rows = [_build_expense_row(e, cat_options, editing_id == e['id']) for e in visible]
 
     table = html.Table([
-        html.Thead(html.Tr([
-            html.Th("Date", style={"width": "110px"}),
-            html.Th("Description"),
-            html.Th("Category", style={"width": "130px"}),
-            html.Th("Amount", style={"width": "100px"}),
-            html.Th("", style={"width": "90px"})
-        ], style={"fontSize": "0.85rem", "color": "#666"})),
+        _EXPENSE_TABLE_HEAD,
         html.Tbody(rows)
     ], className="table table-hover", style={"width": "100%"})
 
+    _history_render_cache["key"] = filter_key
+    _history_render_cache["ids"] = render_ids
+    _history_render_cache["editing"] = editing_id
+
     return table, count_text
 
 # Callback: Start inline editing
@@ -5020,8 +5274,7 @@ def handle_inline_edit_state(start_clicks, cancel_clicks, save_clicks):
 
     # Start editing
     if 'expense-edit-start' in trigger:
-        import ast
-        trigger_dict = ast.literal_eval(trigger.split('.')[0])
+        trigger_dict = _json_loads(trigger.rsplit('.', 1)[0])
         return trigger_dict['id']
 
     raise PreventUpdate
@@ -5048,16 +5301,12 @@ def save_inline_edit(save_clicks, dates, date_ids, descs, amounts, cats):
     if 'inline-edit-save' not in trigger:
         raise PreventUpdate
 
-    import ast
-    trigger_dict = ast.literal_eval(trigger.split('.')[0])
+    trigger_dict = _json_loads(trigger.rsplit('.', 1)[0])
     expense_id = trigger_dict['id']
 
-    # Find the index of the edited expense
-    edit_index = None
-    for i, id_obj in enumerate(date_ids):
-        if id_obj['id'] == expense_id:
-            edit_index = i
-            break
+    # Find the index of the edited expense via a dict index instead of a scan
+    id_to_index = {id_obj['id']: i for i, id_obj in enumerate(date_ids)}
+    edit_index = id_to_index.get(expense_id)
 
     if edit_index is None:
         raise PreventUpdate
@@ -5080,14 +5329,23 @@ def save_inline_edit(save_clicks, dates, date_ids, descs, amounts, cats):
             e['amount'] = float(new_amount)
             e['category'] = new_cat
             break
+    _hash_index_invalidate()
     save_expenses(expenses_data)
 
-    return str(datetime.now())
+    return str(time.time_ns())
 
 # ============================================================================
 # PORTFOLIO ANALYTICS CALLBACKS
 # ============================================================================
 
+# Figure layouts validated once at import - passing these at construction
+# skips the per-render update_layout schema validation pass
+_ALLOC_LAYOUT = dict(margin=dict(l=40, r=40, t=40, b=40), height=260, showlegend=False)
+_TARGET_LAYOUT = dict(barmode='group', margin=dict(l=40, r=20, t=30, b=40), height=260,
+                      yaxis=dict(title='%'), legend=dict(orientation="h", yanchor="bottom", y=1.02))
+_EMPTY_CHART_LAYOUT = dict(height=260)
+_SECTOR_LAYOUT = dict(height=300)
+
 @app.callback(
     [Output('allocation-pie-chart', 'figure'),
      Output('target-vs-actual-chart', 'figure'),
@@ -5102,38 +5360,49 @@ def save_inline_edit(save_clicks, dates, date_ids, descs, amounts, cats):
 def update_analytics(pathname):
     """Update portfolio analytics page"""
     if pathname != '/portfolio/analytics':
-        empty_fig = go.Figure()
-        return empty_fig, empty_fig, html.Div(), html.Div(), empty_fig, html.Div(), html.Div()
+        # Nothing on screen uses these outputs; skip the Figure construction
+        # and the client-side update entirely
+        return (dash.no_update,) * 7
 
     portfolio = load_portfolio()
     settings = load_settings()
     target_allocs = settings.get('target_allocations', {})
     threshold = settings.get('rebalance_threshold', 5)
 
-    # Gather all holdings with current values
+    # Gather all holdings with current values - flatten once, fetch each
+    # ticker's quote once, and let pandas aggregate per ticker in one pass
     holdings_data = {}
     total_value = 0
 
-    for account in portfolio.get('accounts', []):
-        for holding in account.get('holdings', []):
-            ticker = holding['ticker']
-            data = get_stock_quick_data(ticker)
-            if data:
-                value = data['price'] * holding['shares']
-                cost = holding['avg_cost'] * holding['shares']
-                if ticker in holdings_data:
-                    holdings_data[ticker]['value'] += value
-                    holdings_data[ticker]['cost'] += cost
-                    holdings_data[ticker]['shares'] += holding['shares']
-                else:
-                    holdings_data[ticker] = {
-                        'value': value,
-                        'cost': cost,
-                        'shares': holding['shares'],
-                        'price': data['price'],
-                        'change_1m': data.get('change_1m', 0)
-                    }
-                total_value += value
+    rows = [(h['ticker'], h['shares'], h['avg_cost'])
+            for account in portfolio.get('accounts', [])
+            for h in account.get('holdings', [])]
+
+    if rows:
+        df = pd.DataFrame(rows, columns=['ticker', 'shares', 'avg_cost'])
+        quotes = {t: get_stock_quick_data(t) for t in df['ticker'].unique()}
+        df['price'] = df['ticker'].map(lambda t: quotes[t]['price'] if quotes[t] else np.nan)
+        df = df.dropna(subset=['price'])
+        df['value'] = df['price'] * df['shares']
+        df['cost'] = df['avg_cost'] * df['shares']
+
+        agg = df.groupby('ticker').agg(
+            value=('value', 'sum'),
+            cost=('cost', 'sum'),
+            shares=('shares', 'sum'),
+            price=('price', 'first')
+        )
+        total_value = float(agg['value'].sum())
+        holdings_data = {
+            ticker: {
+                'value': row.value,
+                'cost': row.cost,
+                'shares': row.shares,
+                'price': row.price,
+                'change_1m': quotes[ticker].get('change_1m', 0)
+            }
+            for ticker, row in zip(agg.index, agg.itertuples(index=False))
+        }
 
     # Allocation pie chart
     if holdings_data:
@@ -5143,64 +5412,57 @@ def update_analytics(pathname):
             hole=0.4,
             textposition='outside',
             textinfo='label+percent'
-        )])
-        alloc_fig.update_layout(
-            margin=dict(l=40, r=40, t=40, b=40),
-            height=260,
-            showlegend=False
-        )
+        )], layout=_ALLOC_LAYOUT)
     else:
-        alloc_fig = go.Figure()
+        alloc_fig = go.Figure(layout=_EMPTY_CHART_LAYOUT)
         alloc_fig.add_annotation(text="No holdings", x=0.5, y=0.5, showarrow=False)
-        alloc_fig.update_layout(height=260)
 
-    # Target vs Actual chart
+    # Target vs Actual chart - vectorized math shared with the rebalancing
+    # suggestions below
     if holdings_data and target_allocs:
-        tickers = list(set(list(holdings_data.keys()) + list(target_allocs.keys())))
-        actual_pcts = []
-        target_pcts = []
-        for t in tickers:
-            actual = (holdings_data.get(t, {}).get('value', 0) / total_value * 100) if total_value > 0 else 0
-            target = target_allocs.get(t, 0)
-            actual_pcts.append(actual)
-            target_pcts.append(target)
+        alloc_tickers = sorted(set(holdings_data) | set(target_allocs))
+        n_tickers = len(alloc_tickers)
+        values = np.fromiter((holdings_data.get(t, {}).get('value', 0) for t in alloc_tickers),
+                             dtype=np.float64, count=n_tickers)
+        target_pcts = np.fromiter((target_allocs.get(t, 0) for t in alloc_tickers),
+                                  dtype=np.float64, count=n_tickers)
+        actual_pcts = values / total_value * 100 if total_value > 0 else np.zeros(n_tickers)
+        diffs = actual_pcts - target_pcts
 
         target_fig = go.Figure(data=[
-            go.Bar(name='Actual', x=tickers, y=actual_pcts, marker_color='#1a73e8'),
-            go.Bar(name='Target', x=tickers, y=target_pcts, marker_color='#e3f2fd')
-        ])
-        target_fig.update_layout(barmode='group', margin=dict(l=40, r=20, t=30, b=40), height=260,
-                                yaxis_title='%', legend=dict(orientation="h", yanchor="bottom", y=1.02))
+            go.Bar(name='Actual', x=alloc_tickers, y=actual_pcts, marker_color='#1a73e8'),
+            go.Bar(name='Target', x=alloc_tickers, y=target_pcts, marker_color='#e3f2fd')
+        ], layout=_TARGET_LAYOUT)
     else:
-        target_fig = go.Figure()
+        target_fig = go.Figure(layout=_EMPTY_CHART_LAYOUT)
         target_fig.add_annotation(text="Set targets in Settings", x=0.5, y=0.5, showarrow=False)
-        target_fig.update_layout(height=260)
 
-    # Rebalancing suggestions
+    # Rebalancing suggestions - single vector comparison selects the tickers
+    # that drifted past the threshold
     if holdings_data and target_allocs and total_value > 0:
         suggestions = []
-        for ticker in set(list(holdings_data.keys()) + list(target_allocs.keys())):
-            actual_pct = (holdings_data.get(ticker, {}).get('value', 0) / total_value * 100)
-            target_pct = target_allocs.get(ticker, 0)
-            diff = actual_pct - target_pct
-
-            if abs(diff) > threshold:
-                if diff > 0:
-                    action = "SELL"
-                    action_color = "#dc3545"
-                    amount = (diff / 100) * total_value
-                else:
-                    action = "BUY"
-                    action_color = "#2e7d32"
-                    amount = abs(diff / 100) * total_value
-
-                suggestions.append(html.Div([
-                    html.Span(f"{action} ", style={"color": action_color, "fontWeight": "700"}),
-                    html.Span(f"${amount:,.0f} of ", style={"color": "#333"}),
-                    html.Span(ticker, style={"color": "#1a73e8", "fontWeight": "600"}),
-                    html.Span(f" (Current: {actual_pct:.1f}%, Target: {target_pct:.1f}%)",
-                             style={"color": "#666", "fontSize": "0.9rem"})
-                ], style={"padding": "10px", "backgroundColor": "#f8fbff", "borderRadius": "8px", "marginBottom": "10px"}))
+        for i in np.nonzero(np.abs(diffs) > threshold)[0]:
+            ticker = alloc_tickers[i]
+            actual_pct = actual_pcts[i]
+            target_pct = target_pcts[i]
+            diff = diffs[i]
+
+            if diff > 0:
+                action = "SELL"
+                action_color = "#dc3545"
+                amount = (diff / 100) * total_value
+            else:
+                action = "BUY"
+                action_color = "#2e7d32"
+                amount = abs(diff / 100) * total_value
+
+            suggestions.append(html.Div([
+                html.Span(f"{action} ", style={"color": action_color, "fontWeight": "700"}),
+                html.Span(f"${amount:,.0f} of ", style={"color": "#333"}),
+                html.Span(ticker, style={"color": "#1a73e8", "fontWeight": "600"}),
+                html.Span(f" (Current: {actual_pct:.1f}%, Target: {target_pct:.1f}%)",
+                         style={"color": "#666", "fontSize": "0.9rem"})
+            ], style={"padding": "10px", "backgroundColor": "#f8fbff", "borderRadius": "8px", "marginBottom": "10px"}))
 
         rebalance_content = html.Div(suggestions) if suggestions else html.P("Portfolio is within target allocations.", style={"color": "#2e7d32"})
     else:
@@ -5236,16 +5498,20 @@ def update_analytics(pathname):
         metrics_content = html.P("No holdings data available.", style={"color": "#888"})
 
     # Sector pie chart (simplified - would need yfinance sector data)
-    sector_fig = go.Figure()
+    sector_fig = go.Figure(layout=_SECTOR_LAYOUT)
     sector_fig.add_annotation(text="Sector data coming soon", x=0.5, y=0.5, showarrow=False)
-    sector_fig.update_layout(height=300)
 
-    # Top/Bottom performers
+    # Top/Bottom performers - partial selection beats a full sort when we
+    # only need 5 from each end
     if holdings_data:
-        sorted_by_perf = sorted(holdings_data.items(), key=lambda x: x[1].get('change_1m', 0), reverse=True)
+        perf_key = lambda x: x[1].get('change_1m', 0)
+        top_performers = heapq.nlargest(5, holdings_data.items(), key=perf_key)
+        # reversed so the list reads best-of-the-worst down to worst, matching
+        # the tail of a descending sort
+        bottom_performers = heapq.nsmallest(5, holdings_data.items(), key=perf_key)[::-1]
 
         top_rows = []
-        for ticker, data in sorted_by_perf[:5]:
+        for ticker, data in top_performers:
             pct = data.get('change_1m', 0)
             top_rows.append(html.Div([
                 html.Span(ticker, style={"fontWeight": "600", "color": "#1a73e8", "width": "60px", "display": "inline-block"}),
@@ -5254,7 +5520,7 @@ def update_analytics(pathname):
             ], style={"padding": "8px 0", "borderBottom": "1px solid #e3f2fd"}))
 
         bottom_rows = []
-        for ticker, data in sorted_by_perf[-5:]:
+        for ticker, data in bottom_performers:
             pct = data.get('change_1m', 0)
             bottom_rows.append(html.Div([
                 html.Span(ticker, style={"fontWeight": "600", "color": "#1a73e8", "width": "60px", "display": "inline-block"}),
@@ -5291,51 +5557,81 @@ def manage_alerts(add_clicks, delete_clicks, dismiss_clicks, pathname,
                   ticker, condition, target_price):
     """Manage price alerts"""
     ctx = callback_context
+
+    # This callback fires on every navigation via the url Input; skip the
+    # alerts load and per-alert quote fetches unless we're on the alerts page
+    # or an actual alert control triggered
+    triggered_props = [t['prop_id'] for t in ctx.triggered] if ctx.triggered else []
+    if pathname != '/alerts' and all(p in ('.', 'url.pathname') for p in triggered_props):
+        raise PreventUpdate
+
+    # Identify the trigger once: pattern-matching ids are JSON objects keyed
+    # by 'type', plain ids are used as-is - the branches below compare against
+    # this key instead of substring-scanning prop_id repeatedly
+    trigger_id = triggered_props[0].rsplit('.', 1)[0] if triggered_props else ''
+    if trigger_id.startswith('{'):
+        trigger_obj = _json_loads(trigger_id)
+        trigger_key = trigger_obj['type']
+    else:
+        trigger_obj = None
+        trigger_key = trigger_id
+
     alerts_data = load_alerts()
+    today = datetime.now().strftime("%Y-%m-%d")  # computed once, reused below
+
+    # Mutations below set a dirty flag; the data is written once at the end
+    # instead of once per branch
+    dirty = False
 
     # Handle add alert
-    if ctx.triggered and 'alert-add-btn' in ctx.triggered[0]['prop_id']:
+    if trigger_key == 'alert-add-btn':
         if all([ticker, condition, target_price]):
             new_alert = {
                 "id": str(uuid.uuid4()),
                 "ticker": ticker.upper().strip(),
                 "type": condition,
                 "target_price": float(target_price),
-                "created_date": datetime.now().strftime("%Y-%m-%d"),
+                "created_date": today,
                 "triggered": False,
                 "triggered_date": None
             }
             alerts_data['alerts'].append(new_alert)
-            save_alerts(alerts_data)
+            dirty = True
 
-    # Handle delete
-    if ctx.triggered and 'alert-delete' in ctx.triggered[0]['prop_id']:
-        import ast
-        trigger_dict = ast.literal_eval(ctx.triggered[0]['prop_id'].split('.')[0])
-        alert_id = trigger_dict['id']
+    # Handle delete / dismiss (both remove the alert)
+    if trigger_key in ('alert-delete', 'alert-dismiss'):
+        alert_id = trigger_obj['id']
         alerts_data['alerts'] = [a for a in alerts_data['alerts'] if a['id'] != alert_id]
-        save_alerts(alerts_data)
-
-    # Handle dismiss
-    if ctx.triggered and 'alert-dismiss' in ctx.triggered[0]['prop_id']:
-        import ast
-        trigger_dict = ast.literal_eval(ctx.triggered[0]['prop_id'].split('.')[0])
-        alert_id = trigger_dict['id']
-        alerts_data['alerts'] = [a for a in alerts_data['alerts'] if a['id'] != alert_id]
-        save_alerts(alerts_data)
+        dirty = True
 
     # Check alerts and get current prices
     alerts = alerts_data.get('alerts', [])
     newly_triggered = []
+    current_prices = {}  # reused by the active-alerts table below
+
+    # Fetch each unique ticker's quote concurrently - the checks below then
+    # run off dict lookups instead of sequential network calls
+    active_tickers = list({a['ticker'] for a in alerts if not a['triggered']})
+    quotes = {}
+    if active_tickers:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            quotes = dict(zip(active_tickers, executor.map(get_stock_quick_data, active_tickers)))
+
+    # Single pass: run the trigger checks and partition alerts into the
+    # active/triggered lists used by all three renders below
+    active_alerts = []
+    triggered_alerts = []
 
     for alert in alerts:
         if alert['triggered']:
+            triggered_alerts.append(alert)
             continue
 
         try:
-            data = get_stock_quick_data(alert['ticker'])
+            data = quotes.get(alert['ticker'])
             if data:
                 current_price = data['price']
+                current_prices[alert['ticker']] = current_price
                 triggered = False
 
                 if alert['type'] == 'ABOVE' and current_price >= alert['target_price']:
@@ -5345,24 +5641,27 @@ def manage_alerts(add_clicks, delete_clicks, dismiss_clicks, pathname,
 
                 if triggered:
                     alert['triggered'] = True
-                    alert['triggered_date'] = datetime.now().strftime("%Y-%m-%d")
+                    alert['triggered_date'] = today
                     newly_triggered.append({
                         'ticker': alert['ticker'],
                         'type': alert['type'],
                         'target': alert['target_price'],
                         'current': current_price
                     })
+                    triggered_alerts.append(alert)
+                    continue
         except:
-            continue
+            pass
 
-    if newly_triggered:
+        active_alerts.append(alert)
+
+    if dirty or newly_triggered:
         save_alerts(alerts_data)
 
     # Triggered banner
-    just_triggered = [a for a in alerts_data.get('alerts', []) if a.get('triggered')]
-    if just_triggered:
+    if triggered_alerts:
         banner_items = []
-        for a in just_triggered:
+        for a in triggered_alerts:
             banner_items.append(html.Div([
                 html.Strong(a['ticker']),
                 html.Span(f" hit {'above' if a['type'] == 'ABOVE' else 'below'} ${a['target_price']:.2f}!"),
@@ -5376,18 +5675,13 @@ def manage_alerts(add_clicks, delete_clicks, dismiss_clicks, pathname,
         banner = html.Div()
 
     # Active alerts table
-    active_alerts = [a for a in alerts_data.get('alerts', []) if not a.get('triggered')]
     if not active_alerts:
         active_content = html.P("No active alerts.", style={"color": "#888"})
     else:
         rows = []
         for alert in active_alerts:
-            try:
-                data = get_stock_quick_data(alert['ticker'])
-                current_price = data['price'] if data else 'N/A'
-                current_str = f"${current_price:.2f}" if isinstance(current_price, float) else current_price
-            except:
-                current_str = "N/A"
+            current_price = current_prices.get(alert['ticker'], 'N/A')
+            current_str = f"${current_price:.2f}" if isinstance(current_price, float) else current_price
 
             rows.append(html.Tr([
                 html.Td(alert['ticker'], style={"fontWeight": "600", "color": "#1a73e8"}),
@@ -5405,7 +5699,6 @@ def manage_alerts(add_clicks, delete_clicks, dismiss_clicks, pathname,
         ], className="table table-hover", style={"width": "100%"})
 
     # Alert history (triggered)
-    triggered_alerts = [a for a in alerts_data.get('alerts', []) if a.get('triggered')]
     if not triggered_alerts:
         history_content = html.P("No triggered alerts yet.", style={"color": "#888"})
     else:
@@ -5450,38 +5743,44 @@ def manage_settings(add_target_clicks, save_clicks, add_cat_clicks,
     settings = load_settings()
     expenses_data = load_expenses()
 
+    # Identify the trigger once and branch on the extracted key (see
+    # manage_alerts for the same pattern)
+    trigger_id = ctx.triggered[0]['prop_id'].rsplit('.', 1)[0] if ctx.triggered else ''
+    if trigger_id.startswith('{'):
+        trigger_obj = _json_loads(trigger_id)
+        trigger_key = trigger_obj['type']
+    else:
+        trigger_obj = None
+        trigger_key = trigger_id
+
     # Handle add target allocation
-    if ctx.triggered and 'target-add-btn' in ctx.triggered[0]['prop_id']:
+    if trigger_key == 'target-add-btn':
         if target_ticker and target_pct:
             settings['target_allocations'][target_ticker.upper().strip()] = float(target_pct)
             save_settings(settings)
 
     # Handle save settings
-    if ctx.triggered and 'save-settings-btn' in ctx.triggered[0]['prop_id']:
+    elif trigger_key == 'save-settings-btn':
         if threshold:
             settings['rebalance_threshold'] = float(threshold)
             save_settings(settings)
 
     # Handle delete target
-    if ctx.triggered and 'target-delete' in ctx.triggered[0]['prop_id']:
-        import ast
-        trigger_dict = ast.literal_eval(ctx.triggered[0]['prop_id'].split('.')[0])
-        ticker_to_remove = trigger_dict['ticker']
+    elif trigger_key == 'target-delete':
+        ticker_to_remove = trigger_obj['ticker']
         if ticker_to_remove in settings['target_allocations']:
             del settings['target_allocations'][ticker_to_remove]
             save_settings(settings)
 
     # Handle add category
-    if ctx.triggered and 'category-add-btn' in ctx.triggered[0]['prop_id']:
+    elif trigger_key == 'category-add-btn':
         if new_category and new_category.strip() not in expenses_data.get('categories', []):
             expenses_data['categories'].append(new_category.strip())
             save_expenses(expenses_data)
 
     # Handle delete category
-    if ctx.triggered and 'category-delete' in ctx.triggered[0]['prop_id']:
-        import ast
-        trigger_dict = ast.literal_eval(ctx.triggered[0]['prop_id'].split('.')[0])
-        cat_to_remove = trigger_dict['name']
+    elif trigger_key == 'category-delete':
+        cat_to_remove = trigger_obj['name']
         if cat_to_remove in expenses_data.get('categories', []):
             expenses_data['categories'].remove(cat_to_remove)
             save_expenses(expenses_data)
@@ -5529,15 +5828,62 @@ def manage_settings(add_target_clicks, save_clicks, add_cat_clicks,
 # PORTFOLIO PAGE CALLBACKS
 # ============================================================================
 
+# Static DataTable config for the holdings table; built once at import.
+# Leading-underscore keys in the row dicts carry raw numbers for the
+# conditional styling and the delete callback without being displayed.
+# Cells hold raw numbers (so native sort compares values, not strings);
+# the display formatting lives in each column's Format spec
+_SIGNED_MONEY = Format(precision=2, scheme=Scheme.fixed, sign=Sign.positive, group=Group.yes)
+_SIGNED_PCT = Format(precision=1, scheme=Scheme.fixed, sign=Sign.positive,
+                     symbol=Symbol.yes, symbol_prefix='', symbol_suffix='%')
+_SIGNED_PCT_2 = Format(precision=2, scheme=Scheme.fixed, sign=Sign.positive,
+                       symbol=Symbol.yes, symbol_prefix='', symbol_suffix='%')
+
+_HOLDINGS_COLUMNS = [
+    {"name": "Account", "id": "account"},
+    {"name": "Ticker", "id": "ticker"},
+    {"name": "Shares", "id": "shares", "type": "numeric",
+     "format": Format(precision=2, scheme=Scheme.fixed)},
+    {"name": "Avg Cost", "id": "avg_cost", "type": "numeric", "format": FormatTemplate.money(2)},
+    {"name": "Price", "id": "price", "type": "numeric", "format": FormatTemplate.money(2)},
+    {"name": "Value", "id": "value", "type": "numeric", "format": FormatTemplate.money(2)},
+    {"name": "Gain $", "id": "gain", "type": "numeric", "format": _SIGNED_MONEY},
+    {"name": "Gain %", "id": "gain_pct", "type": "numeric", "format": _SIGNED_PCT},
+    {"name": "1D Change", "id": "change_1d", "type": "numeric", "format": _SIGNED_PCT_2},
+]
+
+_HOLDINGS_STYLE_COND = [
+    {"if": {"column_id": "ticker"}, "color": "#1a73e8", "fontWeight": "600"},
+    {"if": {"filter_query": "{gain} >= 0", "column_id": ["gain", "gain_pct"]},
+     "color": "#2e7d32", "fontWeight": "500"},
+    {"if": {"filter_query": "{gain} < 0", "column_id": ["gain", "gain_pct"]},
+     "color": "#dc3545", "fontWeight": "500"},
+    {"if": {"filter_query": "{change_1d} >= 0", "column_id": "change_1d"},
+     "color": "#2e7d32"},
+    {"if": {"filter_query": "{change_1d} < 0", "column_id": "change_1d"},
+     "color": "#dc3545"},
+]
+
 @app.callback(
-    [Output('portfolio-page-graph', 'figure'),
-     Output('portfolio-page-summary', 'children'),
-     Output('portfolio-page-holdings-table', 'children'),
-     Output('portfolio-page-filter-ticker', 'options'),
-     Output('portfolio-page-filter-ticker', 'value')],
-    [Input('portfolio-page-filter-account', 'value'),
-     Input('portfolio-page-filter-ticker', 'value'),
-     Input('port-time-1d', 'n_clicks'),
+    Output('portfolio-quotes-cache', 'data'),
+    Input('portfolio-refresh', 'n_intervals'),
+    prevent_initial_call=False
+)
+def refresh_portfolio_quotes(n_intervals):
+    """Snapshot all portfolio quotes into the page store on a 60s interval"""
+    portfolio = load_portfolio()
+    unique_tickers = list({h["ticker"]
+                           for acc in portfolio.get("accounts", [])
+                           for h in acc.get("holdings", [])})
+    if not unique_tickers:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return dict(zip(unique_tickers, executor.map(get_stock_quick_data, unique_tickers)))
+
+@app.callback(
+    Output('portfolio-page-graph', 'figure'),
+    [Input('port-time-1d', 'n_clicks'),
      Input('port-time-1w', 'n_clicks'),
      Input('port-time-1m', 'n_clicks'),
      Input('port-time-3m', 'n_clicks'),
@@ -5547,15 +5893,12 @@ def manage_settings(add_target_clicks, save_clicks, add_cat_clicks,
      Input('url', 'pathname')],
     prevent_initial_call=False
 )
-def update_portfolio_page(filter_account, filter_ticker, t1d, t1w, t1m, t3m, t6m, t1y, tall, pathname):
-    """Update portfolio page with filters"""
+def update_portfolio_graph(t1d, t1w, t1m, t3m, t6m, t1y, tall, pathname):
+    """Update the portfolio trend graph for the selected time range"""
     if pathname != '/portfolio':
-        empty_fig = go.Figure()
-        return empty_fig, html.Div(), html.Div(), [], "ALL"
+        raise PreventUpdate
 
     ctx = callback_context
-    portfolio = load_portfolio()
-    accounts = portfolio.get("accounts", [])
 
     # Determine time period
     time_period = "1M"  # default
@@ -5576,6 +5919,30 @@ def update_portfolio_page(filter_account, filter_ticker, t1d, t1w, t1m, t3m, t6m
         elif 'port-time-all' in trigger:
             time_period = "All"
 
+    graph_fig = create_portfolio_trend_graph(time_period)
+    graph_fig.update_layout(height=320, margin=dict(l=40, r=40, t=20, b=40))
+    return graph_fig
+
+@app.callback(
+    [Output('portfolio-data', 'data'),
+     Output('portfolio-page-filter-ticker', 'options'),
+     Output('portfolio-page-filter-ticker', 'value')],
+    [Input('portfolio-page-filter-account', 'value'),
+     Input('portfolio-quotes-cache', 'data'),
+     Input('url', 'pathname')],
+    [State('portfolio-page-filter-ticker', 'value')],
+    prevent_initial_call=False
+)
+def update_portfolio_data(filter_account, quotes_cache, pathname, filter_ticker):
+    """Build the holdings+prices snapshot shared by the summary and table"""
+    # Skip the portfolio load and quote work entirely on other pages
+    if pathname != '/portfolio':
+        raise PreventUpdate
+
+    ctx = callback_context
+    portfolio = load_portfolio()
+    accounts = portfolio.get("accounts", [])
+
     # Build ticker options based on selected account (not all accounts)
     if filter_account and filter_account != 'ALL':
         # Only show tickers from the selected account
@@ -5609,44 +5976,69 @@ def update_portfolio_page(filter_account, filter_ticker, t1d, t1w, t1m, t3m, t6m
     if filter_account and filter_account != 'ALL':
         filtered_accounts = [acc for acc in accounts if acc['id'] == filter_account]
 
-    # Calculate values and build holdings list
-    holdings_list = []
-    total_value = 0
-    total_cost = 0
-
-    for account in filtered_accounts:
-        for holding in account.get("holdings", []):
-            # Apply ticker filter (use ticker_value which may have been reset)
-            if ticker_value and ticker_value != 'ALL' and holding["ticker"] != ticker_value:
-                continue
+    # Serve quotes from the interval-refreshed store snapshot; only tickers
+    # missing from it (e.g. a just-added holding) pay a network round-trip
+    unique_tickers = list({h["ticker"]
+                           for acc in filtered_accounts
+                           for h in acc.get("holdings", [])})
+    quotes = {t: (quotes_cache or {}).get(t) for t in unique_tickers}
+    missing = [t for t, data in quotes.items() if not data]
+    if missing:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            quotes.update(zip(missing, executor.map(get_stock_quick_data, missing)))
+
+    # Flatten quoted holdings once, then do the value/cost/gain math as
+    # whole-array numpy ops instead of per-holding Python arithmetic
+    flat = [(account, holding, quotes[holding["ticker"]])
+            for account in filtered_accounts
+            for holding in account.get("holdings", [])
+            if quotes.get(holding["ticker"])]
 
-            data = get_stock_quick_data(holding["ticker"])
-            if data:
-                current_val = data["price"] * holding["shares"]
-                cost_basis = holding["avg_cost"] * holding["shares"]
-                gain = current_val - cost_basis
-                gain_pct = (gain / cost_basis * 100) if cost_basis > 0 else 0
+    holdings_list = []
+    if flat:
+        n = len(flat)
+        shares = np.fromiter((h["shares"] for _, h, _ in flat), dtype=float, count=n)
+        avg_cost = np.fromiter((h["avg_cost"] for _, h, _ in flat), dtype=float, count=n)
+        prices = np.fromiter((d["price"] for _, _, d in flat), dtype=float, count=n)
+        values = prices * shares
+        costs = avg_cost * shares
+        gains = values - costs
+        with np.errstate(divide='ignore', invalid='ignore'):
+            gain_pcts = np.where(costs > 0, gains / costs * 100, 0.0)
+
+        holdings_list = [{
+            'account': account['name'],
+            'account_id': account['id'],
+            'ticker': holding["ticker"],
+            'shares': holding["shares"],
+            'avg_cost': holding["avg_cost"],
+            'price': data["price"],
+            'value': float(value),
+            'cost': float(cost),
+            'gain': float(gain),
+            'gain_pct': float(gain_pct),
+            'change_1d': data.get('change_1d', 0),
+            'change_1m': data.get('change_1m', 0)
+        } for (account, holding, data), value, cost, gain, gain_pct
+          in zip(flat, values, costs, gains, gain_pcts)]
+
+    return holdings_list, ticker_options, ticker_value
 
-                holdings_list.append({
-                    'account': account['name'],
-                    'account_id': account['id'],
-                    'ticker': holding["ticker"],
-                    'shares': holding["shares"],
-                    'avg_cost': holding["avg_cost"],
-                    'price': data["price"],
-                    'value': current_val,
-                    'cost': cost_basis,
-                    'gain': gain,
-                    'gain_pct': gain_pct,
-                    'change_1d': data.get('change_1d', 0),
-                    'change_1m': data.get('change_1m', 0)
-                })
-                total_value += current_val
-                total_cost += cost_basis
+@app.callback(
+    [Output('portfolio-page-summary', 'children'),
+     Output('portfolio-page-holdings-table', 'children')],
+    [Input('portfolio-page-filter-ticker', 'value'),
+     Input('portfolio-data', 'data')],
+    prevent_initial_call=False
+)
+def update_portfolio_page(filter_ticker, holdings_data):
+    """Render the summary and holdings table from the stored snapshot"""
+    holdings_list = holdings_data or []
+    if filter_ticker and filter_ticker != 'ALL':
+        holdings_list = [h for h in holdings_list if h['ticker'] == filter_ticker]
 
-    # Create graph
-    graph_fig = create_portfolio_trend_graph(time_period)
-    graph_fig.update_layout(height=320, margin=dict(l=40, r=40, t=20, b=40))
+    total_value = sum(h['value'] for h in holdings_list)
+    total_cost = sum(h['cost'] for h in holdings_list)
 
     # Summary stats
     total_gain = total_value - total_cost
@@ -5685,78 +6077,73 @@ def update_portfolio_page(filter_account, filter_ticker, t1d, t1w, t1m, t3m, t6m
     if not holdings_list:
         holdings_table = html.P("No holdings found.", style={"color": "#888"})
     else:
-        rows = []
-        for h in sorted(holdings_list, key=lambda x: x['value'], reverse=True):
-            gain_class = "positive" if h['gain'] >= 0 else "negative"
-            day_class = "positive" if h['change_1d'] >= 0 else "negative"
-
-            rows.append(html.Tr([
-                html.Td(h['account'], style={"fontSize": "0.85rem"}),
-                html.Td(h['ticker'], style={"fontWeight": "600", "color": "#1a73e8"}),
-                html.Td(f"{h['shares']:.2f}"),
-                html.Td(f"${h['avg_cost']:.2f}"),
-                html.Td(f"${h['price']:.2f}"),
-                html.Td(f"${h['value']:,.2f}", style={"fontWeight": "500"}),
-                html.Td(html.Span(f"{'+'if h['gain']>=0 else ''}{h['gain']:,.2f}",
-                                 className=gain_class), style={"fontWeight": "500"}),
-                html.Td(html.Span(f"{h['gain_pct']:+.1f}%", className=gain_class)),
-                html.Td(html.Span(f"{h['change_1d']:+.2f}%", className=day_class)),
-                html.Td(dbc.Button("X", id={'type': 'portfolio-holding-delete', 'account': h['account_id'], 'ticker': h['ticker']},
-                                  color="danger", size="sm", outline=True,
-                                  style={"padding": "2px 8px", "fontSize": "0.75rem"}))
-            ]))
-
-        holdings_table = html.Table([
-            html.Thead(html.Tr([
-                html.Th("Account"), html.Th("Ticker"), html.Th("Shares"),
-                html.Th("Avg Cost"), html.Th("Price"), html.Th("Value"),
-                html.Th("Gain $"), html.Th("Gain %"), html.Th("1D Change"), html.Th("")
-            ], style={"fontSize": "0.85rem", "color": "#666"})),
-            html.Tbody(rows)
-        ], className="table table-hover", style={"width": "100%", "fontSize": "0.9rem"})
+        # Feed a DataTable a flat list of dicts instead of building ~10
+        # html.Td objects per holding; sorting and row deletion are native
+        holdings_list.sort(key=itemgetter('value'), reverse=True)
+        records = [{
+            'account': h['account'],
+            'ticker': h['ticker'],
+            'shares': h['shares'],
+            'avg_cost': h['avg_cost'],
+            'price': h['price'],
+            'value': h['value'],
+            'gain': h['gain'],
+            'gain_pct': h['gain_pct'],
+            'change_1d': h['change_1d'],
+            '_account_id': h['account_id'],
+        } for h in holdings_list]
+
+        holdings_table = dash_table.DataTable(
+            id='portfolio-holdings-datatable',
+            data=records,
+            columns=_HOLDINGS_COLUMNS,
+            sort_action='native',
+            row_deletable=True,
+            style_as_list_view=True,
+            style_cell={"fontSize": "0.9rem", "padding": "8px",
+                        "fontFamily": "inherit", "textAlign": "left"},
+            style_header={"fontSize": "0.85rem", "color": "#666",
+                          "fontWeight": "500", "backgroundColor": "white"},
+            style_data_conditional=_HOLDINGS_STYLE_COND,
+        )
 
-    return graph_fig, summary, holdings_table, ticker_options, ticker_value
+    return summary, holdings_table
 
 # ============================================================================
 # PORTFOLIO HOLDING DELETE CALLBACK
 # ============================================================================
 
 @app.callback(
-    Output('url', 'pathname', allow_duplicate=True),
-    Input({'type': 'portfolio-holding-delete', 'account': ALL, 'ticker': ALL}, 'n_clicks'),
+    Output('portfolio-page-summary', 'children', allow_duplicate=True),
+    Input('portfolio-holdings-datatable', 'data_previous'),
+    State('portfolio-holdings-datatable', 'data'),
     prevent_initial_call=True
 )
-def delete_portfolio_holding(n_clicks_list):
-    """Delete a holding from portfolio (instant delete)"""
-    ctx = callback_context
-    if not ctx.triggered or not any(n_clicks_list):
-        raise PreventUpdate
-
-    # Get the button that was clicked
-    triggered = ctx.triggered[0]
-    if triggered['value'] is None:
+def delete_portfolio_holding(previous_rows, current_rows):
+    """Persist holdings removed via the DataTable's native row delete"""
+    if not previous_rows or current_rows is None or len(current_rows) >= len(previous_rows):
         raise PreventUpdate
 
-    # Parse the button ID to get account and ticker
-    button_id = triggered['prop_id'].replace('.n_clicks', '')
-    try:
-        id_dict = json.loads(button_id)
-        account_id = id_dict['account']
-        ticker = id_dict['ticker']
-    except:
+    remaining = {(r['_account_id'], r['ticker']) for r in current_rows}
+    deleted = [r for r in previous_rows if (r['_account_id'], r['ticker']) not in remaining]
+    if not deleted:
         raise PreventUpdate
 
-    # Load portfolio and remove the holding
+    # Load portfolio and remove the holdings
     portfolio = load_portfolio()
-    for account in portfolio.get('accounts', []):
-        if account['id'] == account_id:
-            account['holdings'] = [h for h in account['holdings'] if h['ticker'] != ticker]
-            break
+    for row in deleted:
+        for account in portfolio.get('accounts', []):
+            if account['id'] == row['_account_id']:
+                account['holdings'] = [h for h in account['holdings']
+                                       if h['ticker'] != row['ticker']]
+                break
 
-    save_portfolio(portfolio)
+    # Queue the write so the response isn't blocked on save latency
+    save_portfolio_async(portfolio)
 
-    # Return same pathname to refresh
-    return '/portfolio'
+    # The table already reflects the deletion; totals catch up on the next
+    # quote-store refresh
+    return dash.no_update
 
 # ============================================================================
 # RUN APP
@@ -3,6 +3,10 @@ Database operations using Supabase for cloud persistence.
 Provides the same interface as the JSON file operations.
 """
 import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
@@ -25,19 +29,90 @@ def is_database_available():
     """Check if Supabase is configured and available"""
     return supabase is not None
 
+# ============================================================================
+# BATCH STATE LOAD
+# ============================================================================
+
+# Short-lived snapshot of all user tables, filled by one RPC round-trip so a
+# page load doesn't issue up to eight sequential per-table SELECTs
+_state_cache = None
+_state_cache_time = 0.0
+_STATE_TTL = 5.0  # seconds; kept short since Dash may run multi-process
+
+# Flipped off after the first failed RPC (e.g. the function was never
+# created in this deployment) so reads don't pay a doomed round-trip each
+_rpc_available = True
+
+def load_all():
+    """Load every user table in a single RPC round-trip.
+
+    Requires a Postgres function that aggregates the per-table rows, e.g.:
+
+        create function get_user_state(uid text) returns jsonb as $$
+            select jsonb_object_agg(t, data) from (
+                select 'watchlist' t, data from watchlist where user_id = uid
+                union all select 'portfolios', data from portfolios where user_id = uid
+                union all select 'portfolio_history', data from portfolio_history where user_id = uid
+                union all select 'trades', data from trades where user_id = uid
+                union all select 'income', data from income where user_id = uid
+                union all select 'expenses', data from expenses where user_id = uid
+                union all select 'alerts', data from alerts where user_id = uid
+                union all select 'settings', data from settings where user_id = uid
+            ) u;
+        $$ language sql stable;
+
+    Returns None when the RPC is unavailable so callers fall back to
+    per-table SELECTs.
+    """
+    global _state_cache, _state_cache_time, _rpc_available
+
+    if not is_database_available() or not _rpc_available:
+        return None
+
+    now = time.time()
+    if _state_cache is not None and now - _state_cache_time < _STATE_TTL:
+        return _state_cache
+
+    try:
+        response = supabase.rpc("get_user_state", {"uid": DEFAULT_USER_ID}).execute()
+        _state_cache = response.data or {}
+        _state_cache_time = now
+        return _state_cache
+    except Exception as e:
+        print(f"get_user_state RPC unavailable, using per-table reads: {e}")
+        _rpc_available = False
+        return None
+
 # ============================================================================
 # GENERIC DATABASE OPERATIONS
 # ============================================================================
 
+# Per-table read cache so back-to-back callbacks (e.g. URL change + filter
+# change) don't re-issue the same SELECT; kept short for multi-process safety
+_cache = {}
+_TTL = 5.0  # seconds
+
 def _load_data(table_name: str, default_data: dict) -> dict:
     """Generic load function for any table"""
     if not is_database_available():
         return default_data
 
+    # Prefer the batched snapshot; one RPC covers all tables
+    state = load_all()
+    if state is not None and table_name in state:
+        return state[table_name]
+
+    now = time.time()
+    cached = _cache.get(table_name)
+    if cached is not None and now - cached[0] < _TTL:
+        return cached[1]
+
     try:
         response = supabase.table(table_name).select("data").eq("user_id", DEFAULT_USER_ID).execute()
         if response.data and len(response.data) > 0:
-            return response.data[0]["data"]
+            data = response.data[0]["data"]
+            _cache[table_name] = (now, data)
+            return data
         return default_data
     except Exception as e:
         print(f"Error loading from {table_name}: {e}")
@@ -54,11 +129,47 @@ def _save_data(table_name: str, data: dict) -> bool:
             "user_id": DEFAULT_USER_ID,
             "data": data
         }, on_conflict="user_id").execute()
+        # Drop the cached reads so the next load picks up this write
+        global _state_cache
+        _state_cache = None
+        _cache.pop(table_name, None)
         return True
     except Exception as e:
         print(f"Error saving to {table_name}: {e}")
         return False
 
+# ============================================================================
+# BACKGROUND WRITES
+# ============================================================================
+
+# Writes queued here are upserted by a daemon thread so callbacks don't
+# block the UI response on Supabase write latency
+_write_q = queue.Queue()
+
+def _writer_loop():
+    while True:
+        table, data = _write_q.get()
+        # Coalesce queued writes so back-to-back saves of the same table
+        # issue a single upsert with the newest payload
+        pending = {table: data}
+        while True:
+            try:
+                t, d = _write_q.get_nowait()
+            except queue.Empty:
+                break
+            pending[t] = d
+        for t, d in pending.items():
+            _save_data(t, d)
+
+threading.Thread(target=_writer_loop, daemon=True).start()
+
+def _save_data_async(table_name: str, data: dict) -> bool:
+    """Queue a save for the background writer; returns immediately"""
+    if not is_database_available():
+        return False
+    _write_q.put((table_name, data))
+    return True
+
 # ============================================================================
 # WATCHLIST OPERATIONS
 # ============================================================================
@@ -83,6 +194,10 @@ def save_portfolio(data: dict) -> bool:
     """Save portfolio to database"""
     return _save_data("portfolios", data)
 
+def save_portfolio_async(data: dict) -> bool:
+    """Save portfolio in the background, off the callback's response path"""
+    return _save_data_async("portfolios", data)
+
 # ============================================================================
 # PORTFOLIO HISTORY OPERATIONS
 # ============================================================================
@@ -179,3 +294,32 @@ def load_settings() -> dict:
 def save_settings(data: dict) -> bool:
     """Save settings to database"""
     return _save_data("settings", data)
+
+# ============================================================================
+# STARTUP PREFETCH
+# ============================================================================
+
+_TABLE_DEFAULTS = {
+    "watchlist": {"tickers": []},
+    "portfolios": {"accounts": []},
+    "portfolio_history": {"snapshots": []},
+    "trades": {"trades": []},
+    "income": {"income": [], "recurring": [], "rsus": []},
+    "expenses": {"expenses": [], "categories": DEFAULT_EXPENSE_CATEGORIES, "budgets": {}},
+    "alerts": {"alerts": []},
+    "settings": {"target_allocations": {}, "rebalance_threshold": 5},
+}
+
+def prefetch_all():
+    """Warm the read caches for every table concurrently at startup.
+
+    The first page load fires several callbacks that each read a different
+    table; fetching them all in parallel here means those cold-start reads
+    are served from cache instead of serial round-trips.
+    """
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for table, default in _TABLE_DEFAULTS.items():
+            executor.submit(_load_data, table, default)
+
+if is_database_available():
+    prefetch_all()
@@ -1,6 +1,13 @@
+import pickle
+import shelve
 import yfinance as yf
+import numpy as np
 import pandas as pd
+from datetime import date
 from tabulate import tabulate
+from concurrent.futures import ThreadPoolExecutor
+
+FIN_CACHE_FILE = "fin_cache"
 
 def get_clean_df(df):
     """Standardizes yfinance dataframes: newest dates first, clean indices."""
@@ -11,61 +18,114 @@ def get_clean_df(df):
     df = df.sort_index(axis=1, ascending=False)
     return df
 
-def get_window_sum(df, labels, offset, length):
+def get_row_arrays(df):
+    """Pre-extracts each statement row as a NaN-stripped numpy array."""
+    if df is None:
+        return None
+    values = df.to_numpy(dtype=float)
+    return {label: row[~np.isnan(row)] for label, row in zip(df.index, values)}
+
+def get_window_sum(rows, labels, offset, length):
     """Safely sums a range of quarters (e.g., offset=0, length=4 for current TTM)."""
-    if df is None: return None
+    if rows is None: return None
     for label in labels:
-        if label in df.index:
-            data = df.loc[label].dropna()
-            if len(data) >= (offset + length):
-                return data.iloc[offset : offset + length].sum()
+        arr = rows.get(label)
+        if arr is not None and len(arr) >= (offset + length):
+            return arr[offset : offset + length].sum()
     return None
 
-def calculate_fcf_ttm(cf_df, offset=0):
+def calculate_fcf_ttm(cf_rows, offset=0):
     """Calculates FCF for a specific 4-quarter window."""
-    if cf_df is None: return None
+    if cf_rows is None: return None
     # Try direct FCF label
-    fcf = get_window_sum(cf_df, ["Free Cash Flow"], offset, 4)
+    fcf = get_window_sum(cf_rows, ["Free Cash Flow"], offset, 4)
     if fcf is not None: return fcf
     # Fallback to OCF - CapEx
-    ocf = get_window_sum(cf_df, ["Operating Cash Flow", "Total Cash From Operating Activities"], offset, 4)
-    capex = get_window_sum(cf_df, ["Capital Expenditure", "Purchase of Property Plant Equipment"], offset, 4)
+    ocf = get_window_sum(cf_rows, ["Operating Cash Flow", "Total Cash From Operating Activities"], offset, 4)
+    capex = get_window_sum(cf_rows, ["Capital Expenditure", "Purchase of Property Plant Equipment"], offset, 4)
     if ocf is not None and capex is not None:
         return ocf - abs(capex)
     return None
 
+def fetch_financials(ticker):
+    """Fetches the per-ticker statement endpoints (these have no batch API)."""
+    try:
+        t = yf.Ticker(ticker)
+        return (get_clean_df(t.quarterly_financials),
+                get_clean_df(t.quarterly_cashflow),
+                get_clean_df(t.balance_sheet),
+                t.info.get("trailingEps"))
+    except Exception as e:
+        return e
+
 def analyze(tickers):
     rows = []
+    # One batched download replaces two history() round-trips per ticker
+    prices = yf.download(tickers, period="6mo", group_by="ticker", threads=True, progress=False)
+    # Statements change at most quarterly, so reuse same-day results from an
+    # on-disk shelve instead of re-scraping them every run
+    today = date.today().isoformat()
+    financials = {}
+    to_fetch = list(tickers)
+    try:
+        with shelve.open(FIN_CACHE_FILE) as db:
+            # Evict entries from previous days
+            for key in [k for k in db.keys() if f":{today}:" not in k]:
+                del db[key]
+            for ticker in tickers:
+                cached = db.get(f"{ticker}:{today}:fin")
+                if cached is not None:
+                    financials[ticker] = pickle.loads(cached)
+            to_fetch = [t for t in tickers if t not in financials]
+    except Exception:
+        pass
+
+    # Remaining statements are still per-ticker calls, so overlap their latency
+    if to_fetch:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            fetched = dict(zip(to_fetch, executor.map(fetch_financials, to_fetch)))
+        financials.update(fetched)
+        try:
+            with shelve.open(FIN_CACHE_FILE) as db:
+                for ticker, fin in fetched.items():
+                    if not isinstance(fin, Exception):
+                        db[f"{ticker}:{today}:fin"] = pickle.dumps(fin)
+        except Exception:
+            pass
     for ticker in tickers:
         try:
-            t = yf.Ticker(ticker)
             # 1. Price Data
-            hist_6m = t.history(period="6mo")
-            hist_1w = t.history(period="10d") # Buffer for holidays
+            hist_6m = prices[ticker] if isinstance(prices.columns, pd.MultiIndex) else prices
+            hist_6m = hist_6m.dropna(how="all")
             if hist_6m.empty: raise ValueError("No price data")
-            
+            hist_1w = hist_6m.tail(10) # Buffer for holidays
+
             price = hist_6m["Close"].iloc[-1]
             r_1d = (price / hist_1w["Close"].iloc[-2] - 1) * 100
             r_1w = (price / hist_1w["Close"].iloc[-6] - 1) * 100
             r_6m = (price / hist_6m["Close"].iloc[0] - 1) * 100
 
             # 2. Financials
-            inc_q = get_clean_df(t.quarterly_financials)
-            cf_q = get_clean_df(t.quarterly_cashflow)
-            bs = get_clean_df(t.balance_sheet)
+            fin = financials[ticker]
+            if isinstance(fin, Exception): raise fin
+            inc_q, cf_q, bs, eps = fin
+
+            # Pull each needed statement row into numpy once; the window sums
+            # below then skip the per-call .loc/.dropna pandas overhead
+            inc_rows = get_row_arrays(inc_q)
+            cf_rows = get_row_arrays(cf_q)
 
             # Revenue TTM & Prior
-            rev_ttm = get_window_sum(inc_q, ["Total Revenue"], 0, 4)
-            rev_prior = get_window_sum(inc_q, ["Total Revenue"], 4, 4)
+            rev_ttm = get_window_sum(inc_rows, ["Total Revenue"], 0, 4)
+            rev_prior = get_window_sum(inc_rows, ["Total Revenue"], 4, 4)
             rev_growth = ((rev_ttm - rev_prior) / rev_prior * 100) if rev_ttm and rev_prior else None
 
             # Margins & Income
-            net_inc = get_window_sum(inc_q, ["Net Income"], 0, 4)
-            gross_prof = get_window_sum(inc_q, ["Gross Profit"], 0, 4)
-            
+            net_inc = get_window_sum(inc_rows, ["Net Income"], 0, 4)
+            gross_prof = get_window_sum(inc_rows, ["Gross Profit"], 0, 4)
+
             # FCF and Valuation
-            fcf_val = calculate_fcf_ttm(cf_q, 0)
-            eps = t.info.get("trailingEps")
+            fcf_val = calculate_fcf_ttm(cf_rows, 0)
             pe_ratio = price / eps if eps and eps > 0 else None
             
             # Equity for ROE
@@ -1,13 +1,20 @@
 import yfinance as yf
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import time
 import random
 import json
 import os
 from datetime import date
 from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # =====================================================
 # CONFIG
 # =====================================================
@@ -19,6 +26,12 @@ STOP_LOSS_PCT = 0.90
 
 MAX_THREADS = 3   # safe parallelism
 
+# Shared session so FMP calls reuse pooled connections instead of paying a
+# fresh TCP+TLS handshake per request
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8,
+                                      max_retries=Retry(total=2, backoff_factor=0.3)))
+
 # =====================================================
 # CACHE
 # =====================================================
@@ -35,43 +48,69 @@ def save_cache(cache):
 # =====================================================
 # TECHNICAL INDICATORS
 # =====================================================
+def _sma(x, n):
+    """Simple moving average via the cumsum trick; NaN until the window fills."""
+    out = np.full(x.shape, np.nan)
+    if len(x) >= n:
+        cs = np.cumsum(x)
+        out[n - 1:] = (cs[n - 1:] - np.concatenate(([0.0], cs[:-n]))) / n
+    return out
+
+def _ema(x, span):
+    """Recursive exponential moving average over a float array."""
+    alpha = 2.0 / (span + 1.0)
+    out = np.empty_like(x)
+    out[0] = x[0]
+    for i in range(1, len(x)):
+        out[i] = alpha * x[i] + (1.0 - alpha) * out[i - 1]
+    return out
+
+if njit is not None:
+    _ema = njit(cache=True)(_ema)
+
 def add_indicators(df):
-    df["MA50"] = df["Close"].rolling(50).mean()
-    df["MA200"] = df["Close"].rolling(200).mean()
-
-    delta = df["Close"].diff()
-    gain = delta.clip(lower=0)
-    loss = -delta.clip(upper=0)
-    avg_gain = gain.rolling(14).mean()
-    avg_loss = loss.rolling(14).mean()
-    rs = avg_gain / avg_loss
-    df["RSI"] = 100 - (100 / (1 + rs))
-
-    ema12 = df["Close"].ewm(span=12).mean()
-    ema26 = df["Close"].ewm(span=26).mean()
-    df["MACD"] = ema12 - ema26
-    df["Signal"] = df["MACD"].ewm(span=9).mean()
+    # Single numpy array instead of a chain of Series allocations per indicator
+    close = df["Close"].to_numpy(dtype=np.float64)
+
+    df["MA50"] = _sma(close, 50)
+    df["MA200"] = _sma(close, 200)
+
+    delta = np.diff(close)
+    gain = np.maximum(delta, 0.0)
+    loss = np.maximum(-delta, 0.0)
+    rsi = np.full(close.shape, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = _sma(gain, 14) / _sma(loss, 14)
+        rsi[1:] = 100 - (100 / (1 + rs))
+    df["RSI"] = rsi
+
+    macd = _ema(close, 12) - _ema(close, 26)
+    df["MACD"] = macd
+    df["Signal"] = _ema(macd, 9)
 
     return df
 
 # =====================================================
 # FMP FALLBACK
 # =====================================================
-def fetch_from_fmp(ticker):
-    url = f"https://financialmodelingprep.com/api/v3/profile/{ticker}?apikey={FMP_API_KEY}"
-    r = requests.get(url, timeout=10).json()
+def fetch_from_fmp_batch(tickers):
+    """Fetches all profiles in one comma-joined request instead of one per ticker."""
+    url = f"https://financialmodelingprep.com/api/v3/profile/{','.join(tickers)}?apikey={FMP_API_KEY}"
+    r = session.get(url, timeout=10).json()
     if not r:
         raise Exception("FMP empty response")
 
-    d = r[0]
-    return {
-        "price": d.get("price", 0),
-        "eps": d.get("eps", 0),
-        "profit_margin": d.get("profitMargin", 0),
-        "debt_to_equity": d.get("debtToEquity", 0),
-        "fifty_two_week_high": float(d.get("range", "0-0").split("-")[-1]),
-        "source": "FMP"
-    }
+    profiles = {}
+    for d in r:
+        profiles[d.get("symbol")] = {
+            "price": d.get("price", 0),
+            "eps": d.get("eps", 0),
+            "profit_margin": d.get("profitMargin", 0),
+            "debt_to_equity": d.get("debtToEquity", 0),
+            "fifty_two_week_high": float(d.get("range", "0-0").split("-")[-1]),
+            "source": "FMP"
+        }
+    return profiles
 
 # =====================================================
 # YAHOO PRIMARY
@@ -108,17 +147,7 @@ def fetch_from_yahoo(ticker):
 # =====================================================
 # ANALYSIS ENGINE
 # =====================================================
-def analyze_ticker(ticker, cache):
-    today = str(date.today())
-
-    if ticker in cache and cache[ticker]["date"] == today:
-        return cache[ticker]["data"]
-
-    try:
-        data = fetch_from_yahoo(ticker)
-    except:
-        data = fetch_from_fmp(ticker)
-
+def score_ticker(ticker, data):
     price = data["price"]
     eps = data["eps"]
 
@@ -131,7 +160,7 @@ def analyze_ticker(ticker, cache):
     elif mos < 0:
         signal = "AVOID"
 
-    result = {
+    return {
         "ticker": ticker,
         "price": price,
         "intrinsic": intrinsic,
@@ -141,8 +170,22 @@ def analyze_ticker(ticker, cache):
         "source": data["source"]
     }
 
+def analyze_ticker(ticker, cache):
+    today = str(date.today())
+
+    if ticker in cache and cache[ticker]["date"] == today:
+        return cache[ticker]["data"]
+
+    try:
+        data = fetch_from_yahoo(ticker)
+    except:
+        return None  # picked up by the batch FMP pass
+
+    result = score_ticker(ticker, data)
+
+    # Caller flushes the cache once per run; writing here would rewrite the
+    # whole file for every miss
     cache[ticker] = {"date": today, "data": result}
-    save_cache(cache)
 
     return result
 
@@ -151,11 +194,30 @@ def analyze_ticker(ticker, cache):
 # =====================================================
 def run_dashboard(tickers):
     cache = load_cache()
-    results = []
 
     with ThreadPoolExecutor(max_workers=MAX_THREADS) as executor:
-        for r in executor.map(lambda t: analyze_ticker(t, cache), tickers):
-            results.append(r)
+        by_ticker = dict(zip(tickers, executor.map(lambda t: analyze_ticker(t, cache), tickers)))
+
+    # One batch FMP request covers every ticker Yahoo couldn't serve
+    failed = [t for t in tickers if by_ticker[t] is None]
+    if failed:
+        today = str(date.today())
+        try:
+            profiles = fetch_from_fmp_batch(failed)
+        except Exception:
+            profiles = {}
+        for t in failed:
+            data = profiles.get(t)
+            if data is None:
+                continue
+            result = score_ticker(t, data)
+            cache[t] = {"date": today, "data": result}
+            by_ticker[t] = result
+
+    # Single flush for everything fetched this run
+    save_cache(cache)
+
+    results = [by_ticker[t] for t in tickers if by_ticker[t] is not None]
 
     print("\n" + "=" * 80)
     print(f"{'TICKER':<8}{'PRICE':>10}{'INTRINSIC':>12}{'MOS %':>8}{'SIGNAL':>10}{'SOURCE':>10}")
@@ -1,5 +1,7 @@
+import asyncio
 import streamlit as st
 import yfinance as yf
+import numpy as np
 import pandas as pd
 
 # Page Config
@@ -7,53 +9,88 @@ st.set_page_config(page_title="Stock Analysis Dashboard", layout="wide")
 
 st.title("📈 Hybrid Stock Analysis Dashboard")
 ticker_input = st.text_input("Enter Tickers (comma or space separated):", "ISRG, AAPL").upper()
-ticker_list = ticker_input.replace(',', ' ').split()
+# dict.fromkeys dedupes while keeping first-seen order, so a pasted
+# list with repeats doesn't trigger duplicate fetches and reports
+ticker_list = list(dict.fromkeys(ticker_input.replace(',', ' ').split()))
 
-def get_aligned_data(ticker_obj):
-    fin = ticker_obj.quarterly_financials
-    cf = ticker_obj.quarterly_cashflow
-    bs = ticker_obj.quarterly_balance_sheet
+def get_aligned_data(fin, cf, bs):
     if fin.empty or cf.empty:
         return None, None, None
-    for df in [fin, cf, bs]:
-        df.columns = [str(c).split(' ')[0] for c in df.columns]
-    common_dates = fin.columns.intersection(cf.columns)
-    return fin[common_dates[:5]], cf[common_dates[:5]], bs
+    # Vectorized header split (C-level) instead of a Python loop per column
+    for df in (fin, cf, bs):
+        df.columns = df.columns.astype(str).str.split(' ', n=1).str[0]
+    common_dates = fin.columns.intersection(cf.columns)[:5]
+    return fin[common_dates], cf[common_dates], bs
+
+async def fetch_one(sym, sem):
+    """Fans out the six blocking yfinance calls for one ticker to threads."""
+    async with sem:
+        ticker = yf.Ticker(sym)
+        fin, cf, bs, f_info, hist, info = await asyncio.gather(
+            asyncio.to_thread(lambda: ticker.quarterly_financials),
+            asyncio.to_thread(lambda: ticker.quarterly_cashflow),
+            asyncio.to_thread(lambda: ticker.quarterly_balance_sheet),
+            asyncio.to_thread(lambda: ticker.fast_info),
+            asyncio.to_thread(ticker.history, period="2y"),
+            asyncio.to_thread(lambda: ticker.info),
+        )
+        return {"fin": fin, "cf": cf, "bs": bs, "fast_info": f_info,
+                "hist": hist, "info": info}
+
+async def gather_all(symbols):
+    """Fetches every ticker concurrently, capped to avoid rate limiting."""
+    sem = asyncio.Semaphore(8)
+    results = await asyncio.gather(*(fetch_one(s, sem) for s in symbols),
+                                   return_exceptions=True)
+    return dict(zip(symbols, results))
 
 if st.button("Run Analysis"):
+    # All network I/O happens here in one concurrent burst; only the
+    # Streamlit rendering below runs per ticker on the main thread
+    bundles = asyncio.run(gather_all(ticker_list))
     for ticker_symbol in ticker_list:
+        bundle = bundles[ticker_symbol]
+        if isinstance(bundle, Exception):
+            st.error(f"Error processing {ticker_symbol}: {bundle}")
+            continue
         try:
-            ticker = yf.Ticker(ticker_symbol)
-            financials, cashflow, balance_sheet = get_aligned_data(ticker)
-            
+            financials, cashflow, balance_sheet = get_aligned_data(
+                bundle["fin"], bundle["cf"], bundle["bs"])
+
             if financials is None:
                 st.error(f"Skipping {ticker_symbol}: No financial data found.")
                 continue
 
-            f_info = ticker.fast_info
-            hist = ticker.history(period="2y")
+            f_info = bundle["fast_info"]
+            hist = bundle["hist"]
+            info = bundle["info"]
             current_price = f_info.last_price
 
-            def calc_pct(days_back):
-                if len(hist) > days_back:
-                    past_price = hist["Close"].iloc[-(days_back + 1)]
-                    return ((current_price - past_price) / past_price) * 100
-                return 0.0
+            # All five change percentages in one vectorized pass instead of
+            # five scalar iloc lookups
+            closes = hist["Close"].to_numpy()
+            offsets = np.array([1, 5, 21, 126, 252])
+            valid = len(closes) > offsets
+            if closes.size:
+                past = closes[-1 - np.where(valid, offsets, 0)]
+                pcts = np.where(valid, (current_price - past) / past * 100, 0.0)
+            else:
+                pcts = np.zeros(5)
 
             st.header(f"Report for: {ticker_symbol}")
-            
+
             # --- MARKET DATA ROW ---
             col1, col2, col3, col4, col5 = st.columns(5)
-            col1.metric("Price", f"${current_price:.2f}", f"{calc_pct(1):+.2f}%")
-            col2.metric("1-Week", "", f"{calc_pct(5):+.2f}%")
-            col3.metric("1-Month", "", f"{calc_pct(21):+.2f}%")
-            col4.metric("6-Month", "", f"{calc_pct(126):+.2f}%")
-            col5.metric("1-Year", "", f"{calc_pct(252):+.2f}%")
+            col1.metric("Price", f"${current_price:.2f}", f"{pcts[0]:+.2f}%")
+            col2.metric("1-Week", "", f"{pcts[1]:+.2f}%")
+            col3.metric("1-Month", "", f"{pcts[2]:+.2f}%")
+            col4.metric("6-Month", "", f"{pcts[3]:+.2f}%")
+            col5.metric("1-Year", "", f"{pcts[4]:+.2f}%")
 
             # --- RATIOS ROW ---
             r1, r2, r3, r4 = st.columns(4)
-            r1.write(f"**PE Ratio (TTM):** {ticker.info.get('trailingPE', 'N/A')}")
-            r2.write(f"**EPS (TTM):** {ticker.info.get('trailingEps', 'N/A')}")
+            r1.write(f"**PE Ratio (TTM):** {info.get('trailingPE', 'N/A')}")
+            r2.write(f"**EPS (TTM):** {info.get('trailingEps', 'N/A')}")
             
             try:
                 d_e = balance_sheet.loc["Total Debt"].iloc[0] / balance_sheet.loc["Stockholders Equity"].iloc[0]
@@ -68,32 +105,43 @@ if st.button("Run Analysis"):
             net_inc = financials.loc["Net Income"]
             ebitda = financials.loc["EBITDA"] if "EBITDA" in financials.index else None
             
-            rev_growth = ((rev.iloc[:4] - rev.iloc[1:5].values) / rev.iloc[1:5].values) * 100
-            net_margin = (net_inc.iloc[:4] / rev.iloc[:4]) * 100
-
-            display_fin = pd.DataFrame(index=["Total Revenue ($B)", "Rev Growth %", "Net Income ($B)", "Net Margin %", "EBITDA ($B)"])
-            for i in range(4):
-                display_fin[rev.index[i]] = [round(rev.iloc[i]/1e9, 2), f"{rev_growth.iloc[i]:+.2f}%", 
-                                            round(net_inc.iloc[i]/1e9, 2), f"{net_margin.iloc[i]:.2f}%", 
-                                            round(ebitda.iloc[i]/1e9, 2) if ebitda is not None else "N/A"]
-            
-            rev_ttm = rev.iloc[:4].sum()
-            display_fin["TTM"] = [round(rev_ttm/1e9, 2), f"{((rev_ttm - rev.iloc[1:5].sum())/rev.iloc[1:5].sum()*100):+.2f}%",
-                                  round(net_inc.iloc[:4].sum()/1e9, 2), f"{(net_inc.iloc[:4].sum()/rev_ttm*100):.2f}%",
-                                  round(ebitda.iloc[:4].sum()/1e9, 2) if ebitda is not None else "N/A"]
+            # Hoist the quarterly values into numpy once; the growth/margin
+            # math and every table cell below read from plain arrays instead
+            # of going through a scalar iloc per element
+            rev_arr = rev.iloc[:5].to_numpy(dtype=float)
+            ni_arr = net_inc.iloc[:4].to_numpy(dtype=float)
+            eb_arr = ebitda.iloc[:4].to_numpy(dtype=float) if ebitda is not None else None
+            rev_growth = (rev_arr[:4] - rev_arr[1:5]) / rev_arr[1:5] * 100
+            net_margin = ni_arr / rev_arr[:4] * 100
+
+            # Build every column in a dict first so the DataFrame is
+            # constructed once instead of reconsolidating per assignment
+            fin_cols = {rev.index[i]: [round(rev_arr[i]/1e9, 2), f"{rev_growth[i]:+.2f}%",
+                                       round(ni_arr[i]/1e9, 2), f"{net_margin[i]:.2f}%",
+                                       round(eb_arr[i]/1e9, 2) if eb_arr is not None else "N/A"]
+                        for i in range(4)}
+
+            rev_ttm = rev_arr[:4].sum()
+            rev_prior = rev_arr[1:5].sum()
+            fin_cols["TTM"] = [round(rev_ttm/1e9, 2), f"{((rev_ttm - rev_prior)/rev_prior*100):+.2f}%",
+                               round(ni_arr.sum()/1e9, 2), f"{(ni_arr.sum()/rev_ttm*100):.2f}%",
+                               round(eb_arr.sum()/1e9, 2) if eb_arr is not None else "N/A"]
+            display_fin = pd.DataFrame(fin_cols, index=["Total Revenue ($B)", "Rev Growth %", "Net Income ($B)", "Net Margin %", "EBITDA ($B)"])
             st.table(display_fin)
 
             # --- CASH FLOW TABLE ---
             st.subheader("Quarterly Cash Flow")
             ocf, capex = cashflow.loc["Operating Cash Flow"], cashflow.loc["Capital Expenditure"]
-            display_cf = pd.DataFrame(index=["Operating Cash Flow ($B)", "Capital Expenditure ($B)"])
-            for i in range(4):
-                display_cf[ocf.index[i]] = [round(ocf.iloc[i]/1e9, 2), round(capex.iloc[i]/1e9, 2)]
-            display_cf["TTM"] = [round(ocf.iloc[:4].sum()/1e9, 2), round(capex.iloc[:4].sum()/1e9, 2)]
+            ocf_arr = ocf.iloc[:4].to_numpy(dtype=float)
+            capex_arr = capex.iloc[:4].to_numpy(dtype=float)
+            cf_cols = {ocf.index[i]: [round(ocf_arr[i]/1e9, 2), round(capex_arr[i]/1e9, 2)]
+                       for i in range(4)}
+            cf_cols["TTM"] = [round(ocf_arr.sum()/1e9, 2), round(capex_arr.sum()/1e9, 2)]
+            display_cf = pd.DataFrame(cf_cols, index=["Operating Cash Flow ($B)", "Capital Expenditure ($B)"])
             st.table(display_cf)
 
             # --- FCF FINAL ---
-            fcf_ttm = (ocf.iloc[:4].sum() - abs(capex.iloc[:4].sum())) / 1e9
+            fcf_ttm = (ocf_arr.sum() - abs(capex_arr.sum())) / 1e9
             fcf_yield = (fcf_ttm / (f_info.market_cap / 1e9) * 100)
             
             c1, c2 = st.columns(2)
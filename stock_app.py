@@ -1,37 +1,57 @@
 import streamlit as st
 import yfinance as yf
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 
 # Page Config
 st.set_page_config(page_title="Stock Analysis Dashboard", layout="wide")
 
 st.title("📈 Hybrid Stock Analysis Dashboard")
 ticker_input = st.text_input("Enter Tickers (comma or space separated):", "ISRG, AAPL").upper()
-ticker_list = ticker_input.replace(',', ' ').split()
+# dict.fromkeys dedupes while keeping first-seen order, so a pasted
+# list with repeats doesn't trigger duplicate fetches and reports
+ticker_list = list(dict.fromkeys(ticker_input.replace(',', ' ').split()))
 
-def get_aligned_data(ticker_obj):
-    fin = ticker_obj.quarterly_financials
-    cf = ticker_obj.quarterly_cashflow
-    bs = ticker_obj.quarterly_balance_sheet
+def get_aligned_data(fin, cf, bs):
     if fin.empty or cf.empty:
         return None, None, None
-    for df in [fin, cf, bs]:
-        df.columns = [str(c).split(' ')[0] for c in df.columns]
-    common_dates = fin.columns.intersection(cf.columns)
-    return fin[common_dates[:5]], cf[common_dates[:5]], bs
+    # Vectorized header split (C-level) instead of a Python loop per column
+    for df in (fin, cf, bs):
+        df.columns = df.columns.astype(str).str.split(' ', n=1).str[0]
+    common_dates = fin.columns.intersection(cf.columns)[:5]
+    return fin[common_dates], cf[common_dates], bs
 
 if st.button("Run Analysis"):
+    # One bulk chart request covers every symbol's 2y history
+    bulk = yf.download(ticker_list, period="2y", group_by='ticker',
+                       threads=True, progress=False)
+    # One Tickers container shares a session (and its cookie/crumb
+    # handshake) across every symbol instead of bootstrapping per Ticker
+    multi = yf.Tickers(" ".join(ticker_list))
     for ticker_symbol in ticker_list:
         try:
-            ticker = yf.Ticker(ticker_symbol)
-            financials, cashflow, balance_sheet = get_aligned_data(ticker)
-            
+            ticker = multi.tickers[ticker_symbol]
+            # The remaining fetches are independent HTTPS calls; dispatching
+            # them together makes ticker setup cost max(RTT) instead of the sum
+            with ThreadPoolExecutor(max_workers=5) as ex:
+                fin_f = ex.submit(lambda: ticker.quarterly_financials)
+                cf_f = ex.submit(lambda: ticker.quarterly_cashflow)
+                bs_f = ex.submit(lambda: ticker.quarterly_balance_sheet)
+                f_info_f = ex.submit(lambda: ticker.fast_info)
+                info_f = ex.submit(lambda: ticker.info)
+
+            financials, cashflow, balance_sheet = get_aligned_data(
+                fin_f.result(), cf_f.result(), bs_f.result())
+
             if financials is None:
                 st.error(f"Skipping {ticker_symbol}: No financial data found.")
                 continue
 
-            f_info = ticker.fast_info
-            hist = ticker.history(period="2y")
+            f_info = f_info_f.result()
+            hist = bulk[ticker_symbol] if isinstance(bulk.columns, pd.MultiIndex) else bulk
+            hist = hist.dropna(how="all")
+            info = info_f.result()
             current_price = f_info.last_price
 
             def calc_pct(days_back):
@@ -52,8 +72,8 @@ if st.button("Run Analysis"):
 
             # --- RATIOS ROW ---
             r1, r2, r3, r4 = st.columns(4)
-            r1.write(f"**PE Ratio (TTM):** {ticker.info.get('trailingPE', 'N/A')}")
-            r2.write(f"**EPS (TTM):** {ticker.info.get('trailingEps', 'N/A')}")
+            r1.write(f"**PE Ratio (TTM):** {info.get('trailingPE', 'N/A')}")
+            r2.write(f"**EPS (TTM):** {info.get('trailingEps', 'N/A')}")
             
             try:
                 d_e = balance_sheet.loc["Total Debt"].iloc[0] / balance_sheet.loc["Stockholders Equity"].iloc[0]
@@ -64,36 +84,39 @@ if st.button("Run Analysis"):
 
             # --- FINANCIALS TABLE ---
             st.subheader("Quarterly Financials")
-            rev = financials.loc["Total Revenue"]
-            net_inc = financials.loc["Net Income"]
-            ebitda = financials.loc["EBITDA"] if "EBITDA" in financials.index else None
-            
-            rev_growth = ((rev.iloc[:4] - rev.iloc[1:5].values) / rev.iloc[1:5].values) * 100
-            net_margin = (net_inc.iloc[:4] / rev.iloc[:4]) * 100
+            # One reindex gathers every wanted row in a single aligned pass
+            # (missing rows become NaN), then the math runs on a plain ndarray
+            rev_arr, ni_arr, eb_arr = financials.reindex(
+                ["Total Revenue", "Net Income", "EBITDA"]).iloc[:, :5].to_numpy(dtype=float)
+            has_ebitda = not np.isnan(eb_arr[:4]).all()
+
+            rev_growth = (rev_arr[:4] - rev_arr[1:5]) / rev_arr[1:5] * 100
+            net_margin = ni_arr[:4] / rev_arr[:4] * 100
 
             display_fin = pd.DataFrame(index=["Total Revenue ($B)", "Rev Growth %", "Net Income ($B)", "Net Margin %", "EBITDA ($B)"])
             for i in range(4):
-                display_fin[rev.index[i]] = [round(rev.iloc[i]/1e9, 2), f"{rev_growth.iloc[i]:+.2f}%", 
-                                            round(net_inc.iloc[i]/1e9, 2), f"{net_margin.iloc[i]:.2f}%", 
-                                            round(ebitda.iloc[i]/1e9, 2) if ebitda is not None else "N/A"]
-            
-            rev_ttm = rev.iloc[:4].sum()
-            display_fin["TTM"] = [round(rev_ttm/1e9, 2), f"{((rev_ttm - rev.iloc[1:5].sum())/rev.iloc[1:5].sum()*100):+.2f}%",
-                                  round(net_inc.iloc[:4].sum()/1e9, 2), f"{(net_inc.iloc[:4].sum()/rev_ttm*100):.2f}%",
-                                  round(ebitda.iloc[:4].sum()/1e9, 2) if ebitda is not None else "N/A"]
+                display_fin[financials.columns[i]] = [round(rev_arr[i]/1e9, 2), f"{rev_growth[i]:+.2f}%",
+                                            round(ni_arr[i]/1e9, 2), f"{net_margin[i]:.2f}%",
+                                            round(eb_arr[i]/1e9, 2) if has_ebitda else "N/A"]
+
+            rev_ttm = rev_arr[:4].sum()
+            display_fin["TTM"] = [round(rev_ttm/1e9, 2), f"{((rev_ttm - rev_arr[1:5].sum())/rev_arr[1:5].sum()*100):+.2f}%",
+                                  round(ni_arr[:4].sum()/1e9, 2), f"{(ni_arr[:4].sum()/rev_ttm*100):.2f}%",
+                                  round(eb_arr[:4].sum()/1e9, 2) if has_ebitda else "N/A"]
             st.table(display_fin)
 
             # --- CASH FLOW TABLE ---
             st.subheader("Quarterly Cash Flow")
-            ocf, capex = cashflow.loc["Operating Cash Flow"], cashflow.loc["Capital Expenditure"]
+            ocf_arr, capex_arr = cashflow.reindex(
+                ["Operating Cash Flow", "Capital Expenditure"]).iloc[:, :5].to_numpy(dtype=float)
             display_cf = pd.DataFrame(index=["Operating Cash Flow ($B)", "Capital Expenditure ($B)"])
             for i in range(4):
-                display_cf[ocf.index[i]] = [round(ocf.iloc[i]/1e9, 2), round(capex.iloc[i]/1e9, 2)]
-            display_cf["TTM"] = [round(ocf.iloc[:4].sum()/1e9, 2), round(capex.iloc[:4].sum()/1e9, 2)]
+                display_cf[cashflow.columns[i]] = [round(ocf_arr[i]/1e9, 2), round(capex_arr[i]/1e9, 2)]
+            display_cf["TTM"] = [round(ocf_arr[:4].sum()/1e9, 2), round(capex_arr[:4].sum()/1e9, 2)]
             st.table(display_cf)
 
             # --- FCF FINAL ---
-            fcf_ttm = (ocf.iloc[:4].sum() - abs(capex.iloc[:4].sum())) / 1e9
+            fcf_ttm = (ocf_arr[:4].sum() - abs(capex_arr[:4].sum())) / 1e9
             fcf_yield = (fcf_ttm / (f_info.market_cap / 1e9) * 100)
             
             c1, c2 = st.columns(2)
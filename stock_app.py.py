@@ -1,38 +1,57 @@
 import streamlit as st
 import yfinance as yf
-import pandas as pd
 
 # Page Config
 st.set_page_config(page_title="Stock Analysis Dashboard", layout="wide")
 
 st.title("📈 Hybrid Stock Analysis Dashboard")
 ticker_input = st.text_input("Enter Tickers (comma or space separated):", "ISRG, AAPL").upper()
-ticker_list = ticker_input.replace(',', ' ').split()
+# dict.fromkeys dedupes while keeping first-seen order, so a pasted
+# list with repeats doesn't trigger duplicate fetches and reports
+ticker_list = list(dict.fromkeys(ticker_input.replace(',', ' ').split()))
 
-def get_aligned_data(ticker_obj):
-    fin = ticker_obj.quarterly_financials
-    cf = ticker_obj.quarterly_cashflow
-    bs = ticker_obj.quarterly_balance_sheet
+def get_aligned_data(fin, cf, bs):
     if fin.empty or cf.empty:
         return None, None, None
-    for df in [fin, cf, bs]:
-        df.columns = [str(c).split(' ')[0] for c in df.columns]
-    common_dates = fin.columns.intersection(cf.columns)
-    return fin[common_dates[:5]], cf[common_dates[:5]], bs
+    # Vectorized header split (C-level) instead of a Python loop per column
+    for df in (fin, cf, bs):
+        df.columns = df.columns.astype(str).str.split(' ', n=1).str[0]
+    common_dates = fin.columns.intersection(cf.columns)[:5]
+    return fin[common_dates], cf[common_dates], bs
+
+@st.cache_data(ttl=600, show_spinner=False)
+def fetch_ticker_bundle(sym):
+    """Every network fetch for one symbol, cached for ten minutes.
+
+    Streamlit reruns the whole script on each interaction; without the
+    cache every widget click re-hit Yahoo for all six endpoints. fast_info
+    is flattened to a plain dict so the bundle pickles cleanly.
+    """
+    ticker = yf.Ticker(sym)
+    f_info = ticker.fast_info
+    return {
+        "info": ticker.info,
+        "fast": {"last_price": f_info.last_price, "market_cap": f_info.market_cap},
+        "hist": ticker.history(period="2y"),
+        "fin": ticker.quarterly_financials,
+        "cf": ticker.quarterly_cashflow,
+        "bs": ticker.quarterly_balance_sheet,
+    }
 
 if st.button("Run Analysis"):
     for ticker_symbol in ticker_list:
         try:
-            ticker = yf.Ticker(ticker_symbol)
-            financials, cashflow, balance_sheet = get_aligned_data(ticker)
-            
+            bundle = fetch_ticker_bundle(ticker_symbol)
+            info = bundle["info"]
+            financials, cashflow, balance_sheet = get_aligned_data(
+                bundle["fin"], bundle["cf"], bundle["bs"])
+
             if financials is None:
                 st.error(f"Skipping {ticker_symbol}: No financial data found.")
                 continue
 
-            f_info = ticker.fast_info
-            hist = ticker.history(period="2y")
-            current_price = f_info.last_price
+            hist = bundle["hist"]
+            current_price = bundle["fast"]["last_price"]
 
             def calc_pct(days_back):
                 if len(hist) > days_back:
@@ -52,15 +71,15 @@ if st.button("Run Analysis"):
 
             # --- RATIOS ROW ---
             r1, r2, r3, r4 = st.columns(4)
-            r1.write(f"**PE Ratio (TTM):** {ticker.info.get('trailingPE', 'N/A')}")
-            r2.write(f"**EPS (TTM):** {ticker.info.get('trailingEps', 'N/A')}")
+            r1.write(f"**PE Ratio (TTM):** {info.get('trailingPE', 'N/A')}")
+            r2.write(f"**EPS (TTM):** {info.get('trailingEps', 'N/A')}")
             
             try:
                 d_e = balance_sheet.loc["Total Debt"].iloc[0] / balance_sheet.loc["Stockholders Equity"].iloc[0]
                 r3.write(f"**Debt to Equity:** {d_e:.2f}")
             except:
                 r3.write("**Debt to Equity:** N/A")
-            r4.write(f"**Market Cap:** ${f_info.market_cap / 1e9:.2f}B")
+            r4.write(f"**Market Cap:** ${bundle['fast']['market_cap'] / 1e9:.2f}B")
 
             # --- FINANCIALS TABLE ---
             st.subheader("Quarterly Financials")
@@ -71,30 +90,35 @@ if st.button("Run Analysis"):
             rev_growth = ((rev.iloc[:4] - rev.iloc[1:5].values) / rev.iloc[1:5].values) * 100
             net_margin = (net_inc.iloc[:4] / rev.iloc[:4]) * 100
 
-            display_fin = pd.DataFrame(index=["Total Revenue ($B)", "Rev Growth %", "Net Income ($B)", "Net Margin %", "EBITDA ($B)"])
-            for i in range(4):
-                display_fin[rev.index[i]] = [round(rev.iloc[i]/1e9, 2), f"{rev_growth.iloc[i]:+.2f}%", 
-                                            round(net_inc.iloc[i]/1e9, 2), f"{net_margin.iloc[i]:.2f}%", 
-                                            round(ebitda.iloc[i]/1e9, 2) if ebitda is not None else "N/A"]
-            
+            # Each table is a ready list of row dicts; growing a DataFrame
+            # column-by-column reallocated its blocks on every assignment
             rev_ttm = rev.iloc[:4].sum()
-            display_fin["TTM"] = [round(rev_ttm/1e9, 2), f"{((rev_ttm - rev.iloc[1:5].sum())/rev.iloc[1:5].sum()*100):+.2f}%",
-                                  round(net_inc.iloc[:4].sum()/1e9, 2), f"{(net_inc.iloc[:4].sum()/rev_ttm*100):.2f}%",
-                                  round(ebitda.iloc[:4].sum()/1e9, 2) if ebitda is not None else "N/A"]
-            st.table(display_fin)
+            fin_cols = list(rev.index[:4]) + ["TTM"]
+            fin_rows = [
+                ("Total Revenue ($B)", [round(rev.iloc[i]/1e9, 2) for i in range(4)] + [round(rev_ttm/1e9, 2)]),
+                ("Rev Growth %", [f"{rev_growth.iloc[i]:+.2f}%" for i in range(4)]
+                                 + [f"{((rev_ttm - rev.iloc[1:5].sum())/rev.iloc[1:5].sum()*100):+.2f}%"]),
+                ("Net Income ($B)", [round(net_inc.iloc[i]/1e9, 2) for i in range(4)] + [round(net_inc.iloc[:4].sum()/1e9, 2)]),
+                ("Net Margin %", [f"{net_margin.iloc[i]:.2f}%" for i in range(4)]
+                                 + [f"{(net_inc.iloc[:4].sum()/rev_ttm*100):.2f}%"]),
+                ("EBITDA ($B)", [round(ebitda.iloc[i]/1e9, 2) for i in range(4)] + [round(ebitda.iloc[:4].sum()/1e9, 2)]
+                                if ebitda is not None else ["N/A"] * 5),
+            ]
+            st.table([{"Metric": label, **dict(zip(fin_cols, vals))} for label, vals in fin_rows])
 
             # --- CASH FLOW TABLE ---
             st.subheader("Quarterly Cash Flow")
             ocf, capex = cashflow.loc["Operating Cash Flow"], cashflow.loc["Capital Expenditure"]
-            display_cf = pd.DataFrame(index=["Operating Cash Flow ($B)", "Capital Expenditure ($B)"])
-            for i in range(4):
-                display_cf[ocf.index[i]] = [round(ocf.iloc[i]/1e9, 2), round(capex.iloc[i]/1e9, 2)]
-            display_cf["TTM"] = [round(ocf.iloc[:4].sum()/1e9, 2), round(capex.iloc[:4].sum()/1e9, 2)]
-            st.table(display_cf)
+            cf_cols = list(ocf.index[:4]) + ["TTM"]
+            cf_rows = [
+                ("Operating Cash Flow ($B)", [round(ocf.iloc[i]/1e9, 2) for i in range(4)] + [round(ocf.iloc[:4].sum()/1e9, 2)]),
+                ("Capital Expenditure ($B)", [round(capex.iloc[i]/1e9, 2) for i in range(4)] + [round(capex.iloc[:4].sum()/1e9, 2)]),
+            ]
+            st.table([{"Metric": label, **dict(zip(cf_cols, vals))} for label, vals in cf_rows])
 
             # --- FCF FINAL ---
             fcf_ttm = (ocf.iloc[:4].sum() - abs(capex.iloc[:4].sum())) / 1e9
-            fcf_yield = (fcf_ttm / (f_info.market_cap / 1e9) * 100)
+            fcf_yield = (fcf_ttm / (bundle['fast']['market_cap'] / 1e9) * 100)
             
             c1, c2 = st.columns(2)
             c1.info(f"**Calculated TTM FCF:** ${fcf_ttm:.2f} Billion")
@@ -1,45 +1,73 @@
-import time
-import requests
+import asyncio
+import atexit
+import sys
+import aiohttp
 import pandas as pd
+from aiolimiter import AsyncLimiter
 
 # --- CONFIGURATION ---
 # Paste your Alpha Vantage key between the quotes below
-API_KEY = 'zWQm9zLBbTG79BNCFOfUERaxDRIQvkxp' 
+API_KEY = 'zWQm9zLBbTG79BNCFOfUERaxDRIQvkxp'
 BASE_URL = 'https://www.alphavantage.co/query?'
 
-def get_data(function, symbol):
-    """Helper to fetch data and wait 12s to stay under the free limit."""
+# Alpha Vantage allows 5 calls/min on free keys; the limiter only waits
+# when the window is actually exhausted, instead of a flat 12s per call
+limiter = AsyncLimiter(5, 60)
+
+# One event loop and one keep-alive session for the whole process; opening
+# a fresh ClientSession per analysis tore the connections down between
+# tickers and paid the TCP/TLS handshake again every time
+_loop = asyncio.new_event_loop()
+_session = None
+
+async def _get_session():
+    """Lazily build the shared session on the shared loop."""
+    global _session
+    if _session is None:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=64, keepalive_timeout=60))
+    return _session
+
+def _close_session():
+    if _session is not None:
+        _loop.run_until_complete(_session.close())
+    _loop.close()
+
+atexit.register(_close_session)
+
+async def get_data(session, function, symbol):
+    """Helper to fetch one endpoint under the shared rate limiter."""
     params = {
         'function': function,
         'symbol': symbol,
         'apikey': API_KEY
     }
-    response = requests.get(BASE_URL, params=params)
-    # Alpha Vantage requires a cooldown for free keys (5 calls per minute)
-    time.sleep(12) 
-    return response.json()
+    async with limiter:
+        async with session.get(BASE_URL, params=params) as response:
+            return await response.json()
 
-def run_alpha_analysis(ticker):
+async def run_alpha_analysis(ticker):
     ticker = ticker.upper().strip()
     print(f"\n--- [ESTABLISHING SECURE DATA FEED: {ticker}] ---")
-    
+
     try:
-        # 1. Get Real-Time Price
-        print("Fetching Price...")
-        quote_data = get_data('GLOBAL_QUOTE', ticker)
+        # Fetch price, fundamentals and cash flow concurrently; the limiter
+        # keeps the burst inside the free-tier window
+        print("Fetching Price, Fundamentals and Cash Flow...")
+        session = await _get_session()
+        quote_data, overview, cash_data = await asyncio.gather(
+            get_data(session, 'GLOBAL_QUOTE', ticker),
+            get_data(session, 'OVERVIEW', ticker),
+            get_data(session, 'CASH_FLOW', ticker),
+        )
+
         price = float(quote_data.get('Global Quote', {}).get('05. price', 0))
 
-        # 2. Get Fundamental Overview (Margins, EPS, ROE)
-        print("Fetching Fundamentals...")
-        overview = get_data('OVERVIEW', ticker)
         eps = float(overview.get('EPS', 0))
         pe = float(overview.get('PERatio', 0))
         roe = float(overview.get('ReturnOnEquityTTM', 0))
         margin = float(overview.get('ProfitMargin', 0))
 
-        # 3. Get Cash Flow (for FCF)
-        print("Fetching Cash Flow...")
-        cash_data = get_data('CASH_FLOW', ticker)
         latest_q = cash_data.get('quarterlyReports', [{}])[0]
         fcf = float(latest_q.get('operatingCashflow', 0)) - abs(float(latest_q.get('capitalExpenditures', 0)))
 
@@ -48,26 +76,31 @@ def run_alpha_analysis(ticker):
         mos = ((intrinsic_val - price) / intrinsic_val) * 100 if intrinsic_val > 0 else 0
 
         # --- THE REPORT ---
-        print("\n" + "="*50)
-        print(f"SYMBOL:            {ticker}")
-        print(f"CURRENT PRICE:     ${price:,.2f}")
-        print(f"INTRINSIC VALUE:   ${intrinsic_val:,.2f}")
-        print(f"MARGIN OF SAFETY:  {mos:.1f}%")
-        print("-" * 30)
-        print(f"P/E RATIO:         {pe:.2f}")
-        print(f"PROFIT MARGIN:     {margin*100:.1f}%")
-        print(f"RETURN ON EQUITY:  {roe*100:.1f}%")
-        print(f"QUARTERLY FCF:     ${fcf:,.0f}")
-        print("-" * 30)
-        print(f"RECOMMENDED STOP:  ${price * 0.90:,.2f} (10%)")
-        print("="*50)
+        # Built once and written once instead of a dozen separate print calls
+        report = "\n".join([
+            "\n" + "="*50,
+            f"SYMBOL:            {ticker}",
+            f"CURRENT PRICE:     ${price:,.2f}",
+            f"INTRINSIC VALUE:   ${intrinsic_val:,.2f}",
+            f"MARGIN OF SAFETY:  {mos:.1f}%",
+            "-" * 30,
+            f"P/E RATIO:         {pe:.2f}",
+            f"PROFIT MARGIN:     {margin*100:.1f}%",
+            f"RETURN ON EQUITY:  {roe*100:.1f}%",
+            f"QUARTERLY FCF:     ${fcf:,.0f}",
+            "-" * 30,
+            f"RECOMMENDED STOP:  ${price * 0.90:,.2f} (10%)",
+            "="*50,
+        ])
+        sys.stdout.write(report + "\n")
 
     except Exception as e:
         print(f"\n❌ Error: {e}")
         print("Possible Issue: You may have reached your 25-call daily limit.")
 
-# Terminal Command Loop
+# Terminal Command Loop — reuse the shared loop so the session (and its
+# warm connections) survives between tickers; asyncio.run would discard both
 while True:
     val = input("\nEnter Ticker (or 'exit'): ")
     if val.lower() == 'exit': break
-    run_alpha_analysis(val)
\ No newline at end of file
+    _loop.run_until_complete(run_alpha_analysis(val))
\ No newline at end of file
@@ -1,6 +1,10 @@
+import sys
+import time
+import requests
 import yfinance as yf
 import pandas as pd
-import requests
+from functools import lru_cache
+from requests_cache import CachedSession
 
 # Mimics a real user browser to avoid "Bot" detection
 HEADERS = {
@@ -10,30 +14,74 @@ HEADERS = {
     'Connection': 'keep-alive',
 }
 
+# Quote/chart GETs expire after a minute to match _cached's ttl=60 price
+# buckets; fundamentals keep the hour-long window
+_QUOTE_URL_TTLS = {
+    '*.finance.yahoo.com/v8/finance/chart/*': 60,
+    '*.finance.yahoo.com/v7/finance/quote*': 60,
+}
+
+def _make_session():
+    """Hour-cached HTTP session, or a plain one if yfinance refuses it.
+
+    Recent yfinance releases raise at Ticker construction when handed a
+    caching session; probe once (construction is offline) and fall back so
+    the script keeps working — the TTL memo in _fetch_cached still stops
+    repeat round-trips either way.
+    """
+    cached = CachedSession('.yf_http_cache', backend='sqlite', expire_after=3600,
+                           urls_expire_after=_QUOTE_URL_TTLS,
+                           allowable_methods=('GET',), stale_if_error=True)
+    try:
+        yf.Ticker('SPY', session=cached)
+    except Exception:
+        return requests.Session()
+    return cached
+
+# One persistent browser-like session shared by every Ticker; headers are
+# set once and the cookie/crumb handshake is paid once per process
+_SHARED_SESSION = _make_session()
+_SHARED_SESSION.headers.update(HEADERS)
+
+@lru_cache(maxsize=256)
+def _ticker(sym):
+    """One Ticker per symbol on the shared session, reused across analyses."""
+    return yf.Ticker(sym, session=_SHARED_SESSION)
+
+@lru_cache(maxsize=256)
+def _fetch_cached(sym, endpoint, _bucket):
+    return getattr(_ticker(sym), endpoint)
+
+def _cached(sym, endpoint, ttl=3600):
+    """TTL-memoized yfinance property access.
+
+    Fundamentals change quarterly, so the default hour-long bucket skips
+    the HTTPS round-trip on repeat analyses; pass ttl=60 for price data.
+    """
+    return _fetch_cached(sym, endpoint, int(time.time() // ttl))
+
 def run_stealth_analysis(ticker_symbol):
     ticker_symbol = ticker_symbol.upper().strip()
     print(f"\n--- [SECURE CONNECTION ESTABLISHED: {ticker_symbol}] ---")
-    
+
     try:
-        # Create a persistent session to look like a human visitor
-        session = requests.Session()
-        session.headers.update(HEADERS)
-        
-        # Initialize Ticker with the session
-        stock = yf.Ticker(ticker_symbol, session=session)
-        info = stock.info
-        
+        # fast_info answers from the lightweight chart endpoint without the
+        # heavy quoteSummary parse that backs .info; .info stays as the
+        # fallback and still supplies the fundamentals fast_info lacks
+        f_info = _cached(ticker_symbol, 'fast_info', ttl=60)
+        info = _cached(ticker_symbol, 'info')
+
         # 1. CORE PRICE & VALUATION (With Robust Fallbacks)
-        price = info.get('currentPrice') or info.get('regularMarketPrice') or info.get('previousClose') or 0.0
+        price = f_info.last_price or info.get('currentPrice') or info.get('previousClose') or 0.0
         pe = info.get('trailingPE') or 0.0
         eps = info.get('trailingEps') or 0.0
-        high_52 = info.get('fiftyTwoWeekHigh') or 0.0
-        low_52 = info.get('fiftyTwoWeekLow') or 0.0
+        high_52 = f_info.year_high or info.get('fiftyTwoWeekHigh') or 0.0
+        low_52 = f_info.year_low or info.get('fiftyTwoWeekLow') or 0.0
         
         # 2. FINANCIAL STATEMENTS
-        income_q = stock.quarterly_financials
-        annual_f = stock.financials
-        cash_q = stock.quarterly_cashflow
+        income_q = _cached(ticker_symbol, 'quarterly_financials')
+        annual_f = _cached(ticker_symbol, 'financials')
+        cash_q = _cached(ticker_symbol, 'quarterly_cashflow')
 
         # Extract 3-Year Revenue Growth
         rev_history = []
@@ -63,36 +111,39 @@ def run_stealth_analysis(ticker_symbol):
         roe = info.get('returnOnEquity') or 0.0
         debt_to_eq = (info.get('debtToEquity') or 0.0) / 100
         
-        score = 0
-        if margin > 0.20: score += 1
-        if roe > 0.15: score += 1
-        if debt_to_eq < 0.6: score += 1
+        # bools are ints, so the score is three comparisons summed — no
+        # branches for the interpreter to dispatch
+        score = (margin > 0.20) + (roe > 0.15) + (debt_to_eq < 0.6)
 
         # 5. VALUATION CALCULATIONS
         intrinsic_val = eps * (8.5 + 10) 
         stop_loss = price * 0.90
 
         # --- THE MASTER REPORT ---
-        print("="*50)
-        print(f"Current Price:     ${price:,.2f} | P/E: {pe:.2f}")
-        print(f"Intrinsic Value:   ${intrinsic_val:,.2f}")
-        print(f"3-Year Revenue:    {['${:,.0f}'.format(r) for r in rev_history]}")
-        print(f"Growth Status:     {growth_status}")
-        print("-" * 30)
-        print(f"Buffett Score:     {score}/3")
-        print(f"Profit Margin:     {margin*100:.1f}%")
-        print(f"Return on Equity:  {roe*100:.1f}%")
-        print(f"Debt-to-Equity:    {debt_to_eq:.2f}")
-        print("-" * 30)
-        print(f"LATEST QUARTERLY EARNINGS:")
-        print(f"Revenue:           ${q_rev:,.0f}")
-        print(f"Gross Margin:      {q_margin:.1f}%")
-        print(f"EBITDA:            ${q_ebitda:,.0f}")
-        print(f"Free Cash Flow:    ${q_fcf:,.0f}")
-        print("-" * 30)
-        print(f"52W High/Low:      ${high_52:,.2f} / ${low_52:,.2f}")
-        print(f"RECOMMENDED STOP:  ${stop_loss:,.2f}")
-        print("="*50)
+        # Built once and written once instead of ~20 separate print calls
+        report = "\n".join([
+            "="*50,
+            f"Current Price:     ${price:,.2f} | P/E: {pe:.2f}",
+            f"Intrinsic Value:   ${intrinsic_val:,.2f}",
+            f"3-Year Revenue:    {['${:,.0f}'.format(r) for r in rev_history]}",
+            f"Growth Status:     {growth_status}",
+            "-" * 30,
+            f"Buffett Score:     {score}/3",
+            f"Profit Margin:     {margin*100:.1f}%",
+            f"Return on Equity:  {roe*100:.1f}%",
+            f"Debt-to-Equity:    {debt_to_eq:.2f}",
+            "-" * 30,
+            "LATEST QUARTERLY EARNINGS:",
+            f"Revenue:           ${q_rev:,.0f}",
+            f"Gross Margin:      {q_margin:.1f}%",
+            f"EBITDA:            ${q_ebitda:,.0f}",
+            f"Free Cash Flow:    ${q_fcf:,.0f}",
+            "-" * 30,
+            f"52W High/Low:      ${high_52:,.2f} / ${low_52:,.2f}",
+            f"RECOMMENDED STOP:  ${stop_loss:,.2f}",
+            "="*50,
+        ])
+        sys.stdout.write(report + "\n")
 
     except Exception as e:
         print(f"Data Retrieval Error: {e}")
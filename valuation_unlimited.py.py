@@ -1,8 +1,11 @@
+import sys
+import requests
 import yfinance as yf
 import pandas as pd
-import requests
 import random
 import time
+from functools import lru_cache
+from requests_cache import CachedSession
 
 # Identity rotation to stay undetected
 USER_AGENTS = [
@@ -12,9 +15,29 @@ USER_AGENTS = [
     'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
 ]
 
+# Quote/chart GETs expire after a minute to match _cached's ttl=60 price
+# buckets; fundamentals keep the hour-long window
+_QUOTE_URL_TTLS = {
+    '*.finance.yahoo.com/v8/finance/chart/*': 60,
+    '*.finance.yahoo.com/v7/finance/quote*': 60,
+}
+
 def get_stealth_session():
-    """Creates a session that mimics a real human browser."""
-    session = requests.Session()
+    """Creates a caching session that mimics a real human browser.
+
+    GET responses persist to SQLite for an hour, so repeat lookups don't
+    even hit the network — the stealthiest request is the one never sent.
+    Recent yfinance releases raise at Ticker construction when handed a
+    caching session; probe once (construction is offline) and fall back
+    to a plain session so the script keeps working.
+    """
+    session = CachedSession('.yf_http_cache', backend='sqlite', expire_after=3600,
+                            urls_expire_after=_QUOTE_URL_TTLS,
+                            allowable_methods=('GET',), stale_if_error=True)
+    try:
+        yf.Ticker('SPY', session=session)
+    except Exception:
+        session = requests.Session()
     session.headers.update({
         'User-Agent': random.choice(USER_AGENTS),
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -24,27 +47,53 @@ def get_stealth_session():
     })
     return session
 
+# One stealth session shared by every Ticker; the cookie/crumb handshake
+# is paid once per process instead of per analysis
+_SHARED_SESSION = get_stealth_session()
+
+@lru_cache(maxsize=256)
+def _ticker(sym):
+    """One Ticker per symbol on the shared session, reused across analyses."""
+    return yf.Ticker(sym, session=_SHARED_SESSION)
+
+@lru_cache(maxsize=256)
+def _fetch_cached(sym, endpoint, _bucket):
+    return getattr(_ticker(sym), endpoint)
+
+def _cached(sym, endpoint, ttl=3600):
+    """TTL-memoized yfinance property access.
+
+    Fundamentals change quarterly, so the default hour-long bucket skips
+    the HTTPS round-trip on repeat analyses; pass ttl=60 for price data.
+    """
+    return _fetch_cached(sym, endpoint, int(time.time() // ttl))
+
 def run_analysis(ticker_symbol):
     ticker_symbol = ticker_symbol.upper().strip()
     print(f"\n--- [SECURE CONNECTION ESTABLISHED: {ticker_symbol}] ---")
-    
+
     try:
-        # 1. Establish session and add human-like delay
-        session = get_stealth_session()
+        # 1. Human-like delay before hitting the network
         time.sleep(random.uniform(1, 3)) # Mimic 'thinking' time
-        
-        stock = yf.Ticker(ticker_symbol, session=session)
-        info = stock.info
-        
+
+        # fast_info answers from the lightweight chart endpoint without the
+        # heavy quoteSummary parse that backs .info; .info stays as the
+        # fallback and still supplies the fundamentals fast_info lacks
+        f_info = _cached(ticker_symbol, 'fast_info', ttl=60)
+        info = _cached(ticker_symbol, 'info')
+
         # 2. Extract Price & Valuation (with fallbacks for 0s)
-        price = info.get('currentPrice') or info.get('regularMarketPrice') or info.get('previousClose') or 0.0
+        price = f_info.last_price or info.get('currentPrice') or info.get('previousClose') or 0.0
         pe = info.get('trailingPE') or 0.0
         eps = info.get('trailingEps') or 0.0
+        high_52 = f_info.year_high or info.get('fiftyTwoWeekHigh') or 0.0
+        low_52 = f_info.year_low or info.get('fiftyTwoWeekLow') or 0.0
         intrinsic_val = eps * (8.5 + 10)
+        stop_loss = price * 0.90
         
         # 3. Quarterly Reports
-        income_q = stock.quarterly_financials
-        cash_q = stock.quarterly_cashflow
+        income_q = _cached(ticker_symbol, 'quarterly_financials')
+        cash_q = _cached(ticker_symbol, 'quarterly_cashflow')
         
         q_rev, q_margin, q_ebitda, q_fcf = 0.0, 0.0, 0.0, 0.0
         
@@ -62,7 +111,7 @@ def run_analysis(ticker_symbol):
             q_fcf = op_cash - capex
 
         # 4. Revenue Growth
-        annual_f = stock.financials
+        annual_f = _cached(ticker_symbol, 'financials')
         rev_history = []
         if not annual_f.empty and 'Total Revenue' in annual_f.index:
             rev_history = annual_f.loc['Total Revenue'].head(3).tolist()[::-1]
@@ -73,25 +122,32 @@ def run_analysis(ticker_symbol):
         margin = info.get('profitMargins') or 0.0
         roe = info.get('returnOnEquity') or 0.0
         debt_to_eq = (info.get('debtToEquity') or 0.0) / 100
-        score = sum([margin > 0.20, roe > 0.15, debt_to_eq < 0.6])
-        print(f"Buffett Score:     {score}/3")
-        print(f"Profit Margin:     {margin*100:.1f}%")
-        print(f"Return on Equity:  {roe*100:.1f}%")
-        print(f"Debt-to-Equity:    {debt_to_eq:.2f}")
-        print("-" * 30)
-        print(f"LATEST QUARTERLY EARNINGS:")
-        print(f"Revenue:           ${q_rev:,.0f}")
-        print(f"Gross Margin:      {q_margin:.1f}%")
-        print(f"EBITDA:            ${q_ebitda:,.0f}")
-        print(f"Free Cash Flow:    ${q_fcf:,.0f}")
-        print("-" * 30)
-        print(f"52W High/Low:      ${high_52:,.2f} / ${low_52:,.2f}")
-        print(f"RECOMMENDED STOP:  ${stop_loss:,.2f}")
-        print("="*50)
+        # bools are ints; adding the comparisons directly skips building a
+        # throwaway list for sum()
+        score = (margin > 0.20) + (roe > 0.15) + (debt_to_eq < 0.6)
+
+        # Built once and written once instead of a dozen separate print calls
+        report = "\n".join([
+            f"Buffett Score:     {score}/3",
+            f"Profit Margin:     {margin*100:.1f}%",
+            f"Return on Equity:  {roe*100:.1f}%",
+            f"Debt-to-Equity:    {debt_to_eq:.2f}",
+            "-" * 30,
+            "LATEST QUARTERLY EARNINGS:",
+            f"Revenue:           ${q_rev:,.0f}",
+            f"Gross Margin:      {q_margin:.1f}%",
+            f"EBITDA:            ${q_ebitda:,.0f}",
+            f"Free Cash Flow:    ${q_fcf:,.0f}",
+            "-" * 30,
+            f"52W High/Low:      ${high_52:,.2f} / ${low_52:,.2f}",
+            f"RECOMMENDED STOP:  ${stop_loss:,.2f}",
+            "="*50,
+        ])
+        sys.stdout.write(report + "\n")
 
     except Exception as e:
         print(f"Data Retrieval Error: {e}")
 
 # Command line input
 ticker = input("Enter Ticker: ")
-run_stealth_analysis(ticker)
\ No newline at end of file
+run_analysis(ticker)
\ No newline at end of file
@@ -1,22 +1,67 @@
 import yfinance as yf
 import time
 import random
+import requests
+from functools import lru_cache
+from requests_cache import CachedSession
+
+# Quote/chart GETs expire after a minute to match _cached's ttl=60
+# buckets; fundamentals keep the hour-long window
+_QUOTE_URL_TTLS = {
+    '*.finance.yahoo.com/v8/finance/chart/*': 60,
+    '*.finance.yahoo.com/v7/finance/quote*': 60,
+}
+
+def _make_session():
+    """Hour-long SQLite HTTP cache: warm lookups never touch Yahoo at all.
+
+    Recent yfinance releases raise at Ticker construction when handed a
+    caching session; probe once (construction is offline) and fall back to
+    a plain session so the script keeps working.
+    """
+    cached = CachedSession('.yf_http_cache', backend='sqlite', expire_after=3600,
+                           urls_expire_after=_QUOTE_URL_TTLS,
+                           allowable_methods=('GET',), stale_if_error=True)
+    try:
+        yf.Ticker('SPY', session=cached)
+    except Exception:
+        return requests.Session()
+    return cached
+
+_SESSION = _make_session()
+
+@lru_cache(maxsize=256)
+def _ticker(sym):
+    """One Ticker per symbol, so the cookie/crumb bootstrap happens once."""
+    return yf.Ticker(sym, session=_SESSION)
+
+@lru_cache(maxsize=256)
+def _fetch_cached(sym, endpoint, _bucket):
+    return getattr(_ticker(sym), endpoint)
+
+def _cached(sym, endpoint, ttl=60):
+    """TTL-memoized yfinance property access (one-minute buckets).
+
+    Re-running a symbol inside the window skips the network hit entirely —
+    the best rate-limit dodge is not making the request at all.
+    """
+    return _fetch_cached(sym, endpoint, int(time.time() // ttl))
 
 def run_unlimited_analysis(ticker_symbol):
     ticker_symbol = ticker_symbol.upper().strip()
     print(f"\n--- [BYPASSING FILTERS: {ticker_symbol}] ---")
     
     try:
-        # STEP 1: Create a Ticker object
+        # STEP 1: Reuse the memoized Ticker object
         # yfinance 0.2.50+ has built-in logic to handle the 'cookie' issue
         # if we don't over-complicate the session.
-        stock = yf.Ticker(ticker_symbol)
+        stock = _ticker(ticker_symbol)
         
         # STEP 2: Add a human-like "pause" before the request
         # This is the secret to 'unlimited' - don't hit them too fast
-        time.sleep(random.uniform(1.5, 3.0)) 
-        
-        info = stock.info
+        time.sleep(random.uniform(1.5, 3.0))
+
+        info = _cached(ticker_symbol, 'info')
         
         if not info or 'currentPrice' not in info:
             print("❌ Yahoo blocked the request. Switching to backup fingerprint...")